@@ -0,0 +1,42 @@
+// Builds the season charts in the browser from static frames (sent once per
+// page) and per-team series (sent on each team change); see split_figure()
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    season: {
+        overview: function (viewMode, series, frames) {
+            if (!series) {
+                return window.dash_clientside.no_update;
+            }
+            return mergeSeries(frames && frames.overview[viewMode], series[viewMode]);
+        },
+
+        waterfall: function (series, frames) {
+            if (!series) {
+                return window.dash_clientside.no_update;
+            }
+            return mergeSeries(frames && frames.waterfall, series);
+        },
+    },
+});
+
+// Merges a series into its frame: trace by trace, and the layout one level
+// deep. A series holding a whole figure (e.g. a placeholder) is used as is.
+function mergeSeries(frame, series) {
+    if (series.figure) {
+        return series.figure;
+    }
+    if (!frame) {
+        return window.dash_clientside.no_update;
+    }
+    const layout = Object.assign({}, frame.layout);
+    Object.keys(series.layout).forEach(function (key) {
+        const value = series.layout[key];
+        const isObject = value && typeof value === "object" && !Array.isArray(value);
+        layout[key] = isObject ? Object.assign({}, layout[key], value) : value;
+    });
+    return {
+        data: frame.data.map(function (trace, i) {
+            return Object.assign({}, trace, series.data[i]);
+        }),
+        layout: layout,
+    };
+}
@@ -1,34 +1,167 @@
-from dash.dependencies import Input, Output, State
-from dash import callback_context
-from app.components.season_line_charts import create_season_overview
-from app.components.season_waterfall import create_season_waterfall
+from dash.dependencies import ClientsideFunction, Input, Output, State
+from dash import callback_context, no_update
+from app.components.season_line_charts import (
+    VIEW_MODES,
+    create_season_overview,
+    split_season_overview,
+)
+from app.components.season_waterfall import (
+    create_season_waterfall,
+    split_season_waterfall,
+)
 from app.components.summary_cards import create_season_summary_cards
+from app.components.week_detail import create_week_detail
+from app.utils.figure_cache import render_cached, render_key
+from app.utils.season_model import load_season_model
 from app.app import app
 
 
 # Callbacks for Tab 1
 @app.callback(
     [
-        Output("season-overview-chart", "figure"),
+        Output("season-chart-frames", "data"),
+        Output("season-overview-store", "data"),
         Output("season-summary-cards", "children"),
-        Output("season-waterfall", "figure"),
+        Output("season-waterfall-store", "data"),
     ],
     [
         Input("team-dropdown", "value"),
-        Input("view-toggle", "value"),
         # Input("stat-type-toggle", "value"),
     ],
+    [
+        State("league-settings", "data"),
+        State("season-chart-frames", "modified_timestamp"),
+    ],
 )
 def update_season_overview(
     team_id,
-    view_mode,
     # stat_type
+    league_settings=None,
+    frames_timestamp=-1,
+):
+    """Updates the season charts' series and summary cards for a team"""
+    league = league_settings or {}
+    league_id, season = league.get("league_id"), league.get("season")
+
+    # Computed once (and memoized per data version) for all builders
+    model = load_season_model(team_id, league_id, season)
+    summary = None if model is None else model.summary()
+    version = None if model is None else model.versions
+
+    # Rendered outputs are cached per inputs and data version
+    overviews = {
+        view_mode: render_cached(
+            render_key("season-overview", league_id, season, team_id, view_mode),
+            version,
+            lambda view_mode=view_mode: create_season_overview(
+                team_id, view_mode, league_id, season, summary=summary
+            ),
+        )
+        for view_mode in VIEW_MODES
+    }
+    summary_cards = render_cached(
+        render_key("season-summary-cards", league_id, season, team_id),
+        version,
+        lambda: create_season_summary_cards(
+            team_id, league_id, season, summary=summary
+        ),
+    )
+    waterfall = render_cached(
+        render_key("season-waterfall", league_id, season, team_id),
+        version,
+        lambda: create_season_waterfall(
+            team_id, league_id=league_id, season=season, summary=summary
+        ),
+    )
+
+    # Placeholders are sent whole
+    if version is None:
+        return (
+            no_update,
+            {view_mode: {"figure": overviews[view_mode]} for view_mode in VIEW_MODES},
+            summary_cards,
+            {"figure": waterfall},
+        )
+
+    # The browser keeps the static frames (sent with the first team it shows)
+    # and both overview views, so team switches only send the per-team series
+    # and view switches don't reach the server
+    overview_frames, overview_series = {}, {}
+    for view_mode, figure in overviews.items():
+        overview_frames[view_mode], overview_series[view_mode] = split_season_overview(
+            figure
+        )
+    waterfall_frame, waterfall_series = split_season_waterfall(waterfall)
+
+    frames = no_update
+    if frames_timestamp is None or frames_timestamp < 0:
+        frames = {"overview": overview_frames, "waterfall": waterfall_frame}
+    return frames, overview_series, summary_cards, waterfall_series
+
+
+# Rebuild the charts in the browser from their frames and series, so view
+# switches make no server request (see assets/season_charts.js)
+app.clientside_callback(
+    ClientsideFunction(namespace="season", function_name="overview"),
+    Output("season-overview-chart", "figure"),
+    [
+        Input("view-toggle", "value"),
+        Input("season-overview-store", "data"),
+        Input("season-chart-frames", "data"),
+    ],
+)
+
+app.clientside_callback(
+    ClientsideFunction(namespace="season", function_name="waterfall"),
+    Output("season-waterfall", "figure"),
+    [
+        Input("season-waterfall-store", "data"),
+        Input("season-chart-frames", "data"),
+    ],
+)
+
+
+# Player-level detail for the week hovered or clicked on the overview chart,
+# loaded on demand instead of being embedded in the figure
+@app.callback(
+    Output("season-week-detail", "children"),
+    [
+        Input("season-overview-chart", "hoverData"),
+        Input("season-overview-chart", "clickData"),
+    ],
+    [
+        State("team-dropdown", "value"),
+        State("view-toggle", "value"),
+        State("league-settings", "data"),
+    ],
+)
+def update_week_detail(
+    hover_data, click_data, team_id, view_mode, league_settings=None
 ):
-    """Updates the season overview chart and summary cards"""
-    season_chart = create_season_overview(team_id, view_mode)
-    summary_cards = create_season_summary_cards(team_id)
-    season_waterfall = create_season_waterfall(team_id, view_mode)
-    return season_chart, summary_cards, season_waterfall
+    """Shows the breakdown of the week under the cursor (or last clicked)"""
+    triggered = [t["prop_id"] for t in callback_context.triggered]
+    point_data = (
+        click_data if "season-overview-chart.clickData" in triggered else hover_data
+    )
+    if not point_data or not point_data.get("points"):
+        return no_update
+    week = point_data["points"][0]["x"]
+
+    league = league_settings or {}
+    league_id, season = league.get("league_id"), league.get("season")
+    model = load_season_model(team_id, league_id, season)
+    # The detail is built from the full lineups (names, benches), whose
+    # versions can change while the totals' stay the same
+    version = None
+    if model is not None:
+        version = (model.versions, model.slot_tensor().versions)
+    return render_cached(
+        render_key("week-detail", league_id, season, team_id, view_mode, week),
+        version,
+        lambda: create_week_detail(
+            team_id, week, view_mode, league_id, season, model=model
+        ),
+    )
 
 
 # Add modal toggle callback
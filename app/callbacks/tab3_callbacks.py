@@ -0,0 +1,32 @@
+from dash.dependencies import Input, Output
+from dash import dcc
+from app.components.league_charts import create_league_figures
+from app.utils.figure_cache import render_cached, render_key
+from app.utils.league_model import load_league_model
+from app.app import app
+
+
+# Callbacks for Tab 3
+@app.callback(
+    [
+        Output("league-drafted-overview-graph", "figure"),
+        Output("league-actual-overview-graph", "figure"),
+        Output("league-selected-overview-graph", "figure"),
+        Output("league-breakdown-chart", "children"),
+    ],
+    [Input("league-settings", "data")],
+)
+def update_league_breakdown(league_settings):
+    """Updates every League Breakdown chart from one league-wide model"""
+    league = league_settings or {}
+    league_id, season = league.get("league_id"), league.get("season")
+
+    # The figures only change with the league's data, so they are rendered
+    # once per data version rather than on every page load
+    model = load_league_model(league_id=league_id, season=season)
+    drafted, actual, selected, breakdown = render_cached(
+        render_key("league-breakdown", league_id, season),
+        None if model is None else model.versions,
+        lambda: create_league_figures(league_id, season, model=model),
+    )
+    return drafted, actual, selected, dcc.Graph(figure=breakdown)
@@ -0,0 +1,161 @@
+import logging
+import numpy as np
+from app.components.placeholders import create_unavailable_figure
+from app.utils.figure_builder import FigureBuilder, bar, scatter
+from app.utils.league_model import load_league_model
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+# Chart titles per scenario
+SCENARIO_TITLES = {
+    "draft": "Drafted Rosters: Best Possible Weekly Points",
+    "actual_best": "Actual Rosters: Best Possible Weekly Points",
+    "actual_lineup": "Selected Lineups: Actual Weekly Points",
+}
+
+
+def create_league_figures(league_id=None, season=None, model=None):
+    """
+    Creates the League Breakdown tab's figures from one league-wide model
+
+    Args:
+        league_id: League to show (defaults to Config.default_league_id)
+        season: Season to show (defaults to Config.default_season)
+        model: The league's LeagueModel, if already loaded
+
+    Returns:
+        (drafted, actual, selected, breakdown) figures (see FigureBuilder.build)
+    """
+    if model is None:
+        model = load_league_model(league_id=league_id, season=season)
+    if model is None:
+        placeholder = create_unavailable_figure()
+        return placeholder, placeholder, placeholder, placeholder
+
+    logger.info(f"Creating league breakdown for {len(model.team_ids)} teams")
+    overviews = tuple(
+        create_league_overview(model, scenario) for scenario in SCENARIO_TITLES
+    )
+    return overviews + (create_league_breakdown(model),)
+
+
+def create_league_overview(model, scenario):
+    """Creates a line chart of every team's weekly points for one scenario"""
+    row = model.row(scenario)
+    weeks = model.weeks.tolist()
+    points = model.points[row]
+    ranks = model.season_ranks()[row]
+    league_average = model.weekly_averages()[row]
+    # Per-week (points above league average, weekly rank) for the hover text
+    hover = np.stack((model.deltas()[row], model.weekly_ranks()[row]), axis=-1)
+
+    fig = FigureBuilder()
+
+    # One line per team, in order of season rank
+    for t in ranks.argsort():
+        team_id = model.team_ids[t]
+        fig.add_trace(
+            scatter(
+                x=weeks,
+                y=points[t].tolist(),
+                mode="lines+markers",
+                name=f"#{ranks[t]} Team {team_id}",
+                marker=dict(size=5),
+                customdata=hover[t].tolist(),
+                hovertemplate=(
+                    f"Team {team_id}: %{{y:.1f}} pts "
+                    "(%{customdata[0]:+.1f} vs avg, #%{customdata[1]})<extra></extra>"
+                ),
+            )
+        )
+
+    # League average line
+    fig.add_trace(
+        scatter(
+            x=weeks,
+            y=league_average.tolist(),
+            mode="lines",
+            name="League average",
+            line=dict(color="black", dash="dash", width=2),
+            hovertemplate="League average: %{y:.1f} pts<extra></extra>",
+        )
+    )
+
+    fig.update_layout(
+        title=dict(text=SCENARIO_TITLES[scenario], x=0.5, xanchor="center"),
+        xaxis=dict(title=dict(text="Week"), tickmode="linear", tick0=1, dtick=1),
+        yaxis=dict(title=dict(text="Points"), gridcolor="lightgray"),
+        hovermode="x unified",
+        plot_bgcolor="white",
+        legend=dict(font=dict(size=10)),
+        margin=dict(t=50, b=40, l=50, r=20),
+        height=420,
+    )
+    return fig.build()
+
+
+def create_league_breakdown(model):
+    """Creates a waterfall-style bar chart of each team's draft baseline and impacts"""
+    draft_avg, actual_best_avg, _ = model.season_averages()
+    transaction_impact, lineup_impact, efficiency = model.impacts()
+
+    # Teams ordered by actual points scored
+    order = model.season_ranks()[model.row("actual_lineup")].argsort()
+    teams = [f"Team {model.team_ids[t]}" for t in order]
+
+    fig = FigureBuilder()
+    fig.add_trace(
+        bar(
+            x=teams,
+            y=draft_avg[order].tolist(),
+            name="Draft Baseline",
+            marker=dict(color="rgba(30, 144, 255, 0.8)"),
+            hovertemplate="Draft Baseline: %{y:.1f} pts<extra></extra>",
+        )
+    )
+    fig.add_trace(
+        bar(
+            x=teams,
+            y=transaction_impact[order].tolist(),
+            base=draft_avg[order].tolist(),
+            name="Transaction Impact",
+            marker=dict(color="rgba(46, 204, 113, 0.8)"),
+            hovertemplate="Transaction Impact: %{y:+.1f} pts<extra></extra>",
+        )
+    )
+    fig.add_trace(
+        bar(
+            x=teams,
+            y=lineup_impact[order].tolist(),
+            base=actual_best_avg[order].tolist(),
+            name="Lineup Decisions",
+            marker=dict(color="rgba(241, 196, 15, 0.8)"),
+            customdata=efficiency[order].tolist(),
+            hovertemplate=(
+                "Lineup Decisions: %{y:+.1f} pts "
+                "(%{customdata:.0f}% efficient)<extra></extra>"
+            ),
+        )
+    )
+
+    fig.update_layout(
+        title=dict(
+            text="League Performance Breakdown (weekly averages)",
+            x=0.5,
+            xanchor="center",
+        ),
+        barmode="group",
+        plot_bgcolor="white",
+        yaxis=dict(title=dict(text="Weekly Points Average"), gridcolor="lightgray"),
+        legend=dict(
+            orientation="h", yanchor="bottom", y=-0.25, x=0.5, xanchor="center"
+        ),
+        margin=dict(t=50, b=40, l=50, r=20),
+        height=420,
+    )
+    return fig.build()
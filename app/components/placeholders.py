@@ -0,0 +1,33 @@
+import dash_bootstrap_components as dbc
+import plotly.graph_objs as go
+
+UNAVAILABLE_MESSAGE = (
+    "Season data is temporarily unavailable. Please try again in a moment."
+)
+
+
+def create_unavailable_figure(message=UNAVAILABLE_MESSAGE):
+    """Creates an empty chart explaining that its data could not be loaded"""
+    fig = go.Figure()
+    fig.update_layout(
+        xaxis=dict(visible=False),
+        yaxis=dict(visible=False),
+        annotations=[
+            dict(
+                text=message,
+                showarrow=False,
+                xref="paper",
+                yref="paper",
+                x=0.5,
+                y=0.5,
+                font=dict(size=14, color="gray"),
+            )
+        ],
+        template="plotly_white",
+    )
+    return fig
+
+
+def create_unavailable_alert(message=UNAVAILABLE_MESSAGE):
+    """Creates an alert explaining that the summary data could not be loaded"""
+    return dbc.Alert(message, color="warning", className="mb-0")
@@ -1,8 +1,8 @@
-import plotly.graph_objs as go
-import numpy as np
 import logging
-from app.utils.data_fetcher import fetch_lineup_data
-from app.utils.data_processor import process_weekly_data
+from app.components.placeholders import create_unavailable_figure
+from app.utils.figure_builder import FigureBuilder, scatter, split_figure
+from app.utils.fill_geometry import fill_polygons
+from app.utils.season_model import load_season_summary
 
 
 logging.basicConfig(
@@ -12,27 +12,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# View modes of the season overview chart
+VIEW_MODES = ("roster_comparison", "lineup_comparison")
 
-def create_season_overview(team_id, view_mode="roster_comparison"):
+
+def create_season_overview(
+    team_id, view_mode="roster_comparison", league_id=None, season=None, summary=None
+):
     """
     Creates a season overview chart with toggle options
 
     Args:
         team_id: The team ID to fetch data for
         view_mode: Either "roster_comparison" or "lineup_comparison"
+        league_id: League to show (defaults to Config.default_league_id)
+        season: Season to show (defaults to Config.default_season)
+        summary: The team's SeasonSummary, if already loaded
 
     Returns:
-        A plotly figure object
+        A plotly figure (a plain figure dict unless Config.fast_figures is off)
     """
     logger.info(
         f"Creating season overview for team {team_id} with view mode: {view_mode}"
     )
 
     # Fetch and process data
-    data = fetch_chart_data(team_id)
+    data = fetch_chart_data(team_id, league_id, season, summary)
+    if data is None:
+        return create_unavailable_figure()
 
     # Create the base figure
-    fig = go.Figure()
+    fig = FigureBuilder()
 
     # Add appropriate chart elements based on view mode
     if view_mode == "roster_comparison":
@@ -43,74 +53,32 @@ def create_season_overview(team_id, view_mode="roster_comparison"):
     # Apply common layout settings
     apply_common_layout(fig, data, view_mode)
 
-    return fig
-
-
-def fetch_chart_data(team_id):
-    """Fetches and processes all data needed for the charts"""
-    # Fetch data for all scenarios
-    draft_data = fetch_lineup_data(
-        "leagues/47097656/teams/lineups/best-drafted", team_id
-    )
-    actual_best_data = fetch_lineup_data(
-        "leagues/47097656/teams/lineups/best-actual", team_id
-    )
-    actual_lineup_data = fetch_lineup_data(
-        "leagues/47097656/teams/lineups/actual", team_id
-    )
-
-    # Process data
-    draft_weeks, draft_points, draft_hover = process_weekly_data(draft_data)
-    actual_best_weeks, actual_best_points, actual_best_hover = process_weekly_data(
-        actual_best_data
-    )
-    actual_lineup_weeks, actual_lineup_points, actual_lineup_hover = (
-        process_weekly_data(actual_lineup_data)
-    )
-
-    # Calculate averages
-    avg_draft = np.mean(draft_points)
-    avg_actual_best = np.mean(actual_best_points)
-    avg_actual_lineup = np.mean(actual_lineup_points)
-
-    # Calculate efficiency percentages
-    lineup_efficiency = [
-        (actual / best) * 100 if best > 0 else 0
-        for actual, best in zip(actual_lineup_points, actual_best_points)
-    ]
-    avg_efficiency = np.mean(lineup_efficiency)
-
-    # Calculate weekly differences (for roster comparison)
-    weekly_diffs = [
-        actual - draft for actual, draft in zip(actual_best_points, draft_points)
-    ]
-
-    # Calculate y-axis range
-    all_points = draft_points + actual_best_points + actual_lineup_points
-    min_points = min(all_points)
-    y_min = min(80, min_points * 0.8)  # 80% of min or 80, whichever is smaller
-    y_max = max(all_points) * 1.1  # Add 10% padding above highest value
-
-    # Return all data in a dictionary
-    return {
-        "draft_weeks": draft_weeks,
-        "draft_points": draft_points,
-        # "draft_hover": draft_hover,
-        "actual_best_weeks": actual_best_weeks,
-        "actual_best_points": actual_best_points,
-        # "actual_best_hover": actual_best_hover,
-        "actual_lineup_weeks": actual_lineup_weeks,
-        "actual_lineup_points": actual_lineup_points,
-        # "actual_lineup_hover": actual_lineup_hover,
-        "avg_draft": avg_draft,
-        "avg_actual_best": avg_actual_best,
-        "avg_actual_lineup": avg_actual_lineup,
-        "lineup_efficiency": lineup_efficiency,
-        "avg_efficiency": avg_efficiency,
-        "weekly_diffs": weekly_diffs,
-        "y_min": y_min,
-        "y_max": y_max,
-    }
+    return fig.build()
+
+
+def split_season_overview(figure):
+    """
+    Splits an overview figure into its static frame and per-team series
+
+    The frame depends only on the view mode (its fill traces are always
+    present, if empty), so the browser keeps it and each team switch only
+    sends the series: trace arrays, hover values, annotations and axis ranges.
+
+    Returns:
+        (frame, series) figure dicts (see split_figure)
+    """
+    return split_figure(
+        figure,
+        trace_keys=("x", "y", "customdata"),
+        layout_keys=("annotations", "xaxis.range", "yaxis.range"),
+    )
+
+
+def fetch_chart_data(team_id, league_id=None, season=None, summary=None):
+    """Returns all data needed for the charts (None if unavailable)"""
+    if summary is None:
+        summary = load_season_summary(team_id, league_id, season)
+    return None if summary is None else summary.chart_data()
 
 
 def add_roster_comparison_elements(fig, data):
@@ -222,7 +190,7 @@ def add_main_lines_roster(
     """Adds the main line traces for roster comparison view"""
     # Add drafted team line
     fig.add_trace(
-        go.Scatter(
+        scatter(
             x=draft_weeks,
             y=draft_points,
             mode="lines+markers",
@@ -230,14 +198,14 @@ def add_main_lines_roster(
             line=dict(color="blue", width=2),
             marker=dict(size=8),
             legendgroup="draft",
-            legendgrouptitle_text="Drafted Team Performance",
+            legendgrouptitle=dict(text="Drafted Team Performance"),
             hoverinfo="skip",
         )
     )
 
     # Add actual best roster line
     fig.add_trace(
-        go.Scatter(
+        scatter(
             x=actual_best_weeks,
             y=actual_best_points,
             mode="lines+markers",
@@ -245,7 +213,7 @@ def add_main_lines_roster(
             line=dict(color="green", width=2),
             marker=dict(size=8),
             legendgroup="actual",
-            legendgrouptitle_text="Actual Team Performance",
+            legendgrouptitle=dict(text="Actual Team Performance"),
             hoverinfo="skip",
         )
     )
@@ -253,115 +221,41 @@ def add_main_lines_roster(
 
 def add_fill_areas_roster(fig, draft_weeks, draft_points, actual_best_points):
     """Adds fill areas between lines for roster comparison view"""
-    # First, draw the positive fill areas (where actual best is above draft best)
-    positive_x = []
-    positive_y_upper = []
-    positive_y_lower = []
-
-    # Then, draw the negative fill areas (where draft best is above actual best)
-    negative_x = []
-    negative_y_upper = []
-    negative_y_lower = []
-
-    # Process each pair of adjacent points to determine appropriate fill
-    for i in range(len(draft_weeks) - 1):
-        x1, x2 = draft_weeks[i], draft_weeks[i + 1]
-        y1_draft, y2_draft = draft_points[i], draft_points[i + 1]
-        y1_actual, y2_actual = actual_best_points[i], actual_best_points[i + 1]
-
-        # Check if lines cross between these points
-        lines_cross = ((y1_draft > y1_actual) and (y2_draft < y2_actual)) or (
-            (y1_draft < y1_actual) and (y2_draft > y2_actual)
-        )
+    # Green where the actual best roster is above the drafted one, red below
+    (positive_x, positive_y), (negative_x, negative_y) = fill_polygons(
+        draft_weeks, actual_best_points, draft_points
+    )
 
-        if lines_cross:
-            # Calculate intersection point
-            # Line equation: y = mx + b
-            m1 = (y2_draft - y1_draft) / (x2 - x1)
-            b1 = y1_draft - m1 * x1
-
-            m2 = (y2_actual - y1_actual) / (x2 - x1)
-            b2 = y1_actual - m2 * x1
-
-            # Intersection: m1*x + b1 = m2*x + b2 => x = (b2 - b1) / (m1 - m2)
-            if m1 != m2:  # Avoid division by zero
-                x_intersect = (b2 - b1) / (m1 - m2)
-                y_intersect = m1 * x_intersect + b1
-
-                # Add segments to appropriate arrays based on which line is on top
-                if y1_draft < y1_actual:  # First part is positive
-                    # Add positive segment
-                    positive_x.extend([x1, x_intersect])
-                    positive_y_upper.extend([y1_actual, y_intersect])
-                    positive_y_lower.extend([y1_draft, y_intersect])
-
-                    # Add negative segment
-                    negative_x.extend([x_intersect, x2])
-                    negative_y_upper.extend([y_intersect, y2_draft])
-                    negative_y_lower.extend([y_intersect, y2_actual])
-                else:  # First part is negative
-                    # Add negative segment
-                    negative_x.extend([x1, x_intersect])
-                    negative_y_upper.extend([y1_draft, y_intersect])
-                    negative_y_lower.extend([y1_actual, y_intersect])
-
-                    # Add positive segment
-                    positive_x.extend([x_intersect, x2])
-                    positive_y_upper.extend([y_intersect, y2_actual])
-                    positive_y_lower.extend([y_intersect, y2_draft])
-        else:
-            # No crossing, add entire segment to appropriate array
-            if y1_actual >= y1_draft and y2_actual >= y2_draft:  # Positive throughout
-                positive_x.extend([x1, x2])
-                positive_y_upper.extend([y1_actual, y2_actual])
-                positive_y_lower.extend([y1_draft, y2_draft])
-            elif y1_draft >= y1_actual and y2_draft >= y2_actual:  # Negative throughout
-                negative_x.extend([x1, x2])
-                negative_y_upper.extend([y1_draft, y2_draft])
-                negative_y_lower.extend([y1_actual, y2_actual])
-            else:
-                # This shouldn't happen if we correctly detected crossings
-                logger.warning(f"Unexpected line configuration at week {x1}")
-
-    # Add positive fill areas
-    if positive_x:
-        # Create a continuous path for fill: go forward along upper line, then backward along lower line
-        x_path = positive_x + positive_x[::-1]
-        y_path = positive_y_upper + positive_y_lower[::-1]
-
-        fig.add_trace(
-            go.Scatter(
-                x=x_path,
-                y=y_path,
-                fill="toself",
-                fillcolor="rgba(0, 255, 0, 0.2)",  # Green for good transactions
-                line=dict(color="rgba(255,255,255,0)"),
-                hoverinfo="skip",
-                showlegend=False,
-                legendgroup="fill_areas",
-                name="Positive impact areas",
-            )
+    # Add positive fill areas (always, even if empty, so every team's figure
+    # has the same traces)
+    fig.add_trace(
+        scatter(
+            x=positive_x.tolist(),
+            y=positive_y.tolist(),
+            fill="toself",
+            fillcolor="rgba(0, 255, 0, 0.2)",  # Green for good transactions
+            line=dict(color="rgba(255,255,255,0)"),
+            hoverinfo="skip",
+            showlegend=False,
+            legendgroup="fill_areas",
+            name="Positive impact areas",
         )
+    )
 
     # Add negative fill areas
-    if negative_x:
-        # Create a continuous path for fill: go forward along upper line, then backward along lower line
-        x_path = negative_x + negative_x[::-1]
-        y_path = negative_y_upper + negative_y_lower[::-1]
-
-        fig.add_trace(
-            go.Scatter(
-                x=x_path,
-                y=y_path,
-                fill="toself",
-                fillcolor="rgba(255, 0, 0, 0.2)",  # Red for bad transactions
-                line=dict(color="rgba(255,255,255,0)"),
-                hoverinfo="skip",
-                showlegend=False,
-                legendgroup="fill_areas",
-                name="Negative impact areas",
-            )
+    fig.add_trace(
+        scatter(
+            x=negative_x.tolist(),
+            y=negative_y.tolist(),
+            fill="toself",
+            fillcolor="rgba(255, 0, 0, 0.2)",  # Red for bad transactions
+            line=dict(color="rgba(255,255,255,0)"),
+            hoverinfo="skip",
+            showlegend=False,
+            legendgroup="fill_areas",
+            name="Negative impact areas",
         )
+    )
 
 
 def add_average_lines_roster(
@@ -370,7 +264,7 @@ def add_average_lines_roster(
     """Adds average lines for roster comparison view"""
     # Add horizontal average lines with hover text
     fig.add_trace(
-        go.Scatter(
+        scatter(
             x=[min(draft_weeks), max(draft_weeks)],
             y=[avg_draft, avg_draft],
             mode="lines",
@@ -378,13 +272,13 @@ def add_average_lines_roster(
             name="Season average",
             hovertemplate="Best drafted team average: %{y:.1f} pts<extra></extra>",
             legendgroup="draft",
-            legendgrouptitle_text="Drafted Team Performance",
+            legendgrouptitle=dict(text="Drafted Team Performance"),
             showlegend=True,
         )
     )
 
     fig.add_trace(
-        go.Scatter(
+        scatter(
             x=[min(actual_best_weeks), max(actual_best_weeks)],
             y=[avg_actual_best, avg_actual_best],
             mode="lines",
@@ -392,7 +286,7 @@ def add_average_lines_roster(
             name="Season average",
             hovertemplate="Best actual team average: %{y:.1f} pts<extra></extra>",
             legendgroup="actual",
-            legendgrouptitle_text="Actual Team Performance",
+            legendgrouptitle=dict(text="Actual Team Performance"),
             showlegend=True,
         )
     )
@@ -402,26 +296,24 @@ def add_hover_data_roster(
     fig, draft_weeks, draft_points, actual_best_points, weekly_diffs
 ):
     """Adds hover data for roster comparison view"""
-    # Add week-by-week hover data (invisible trace that only appears on hover)
-    hover_text = []
-    for i, week in enumerate(draft_weeks):
-        diff = weekly_diffs[i]
-        diff_sign = "+" if diff > 0 else ""
-        hover_text.append(
-            f"<b>Week {week}</b><br>"
-            f"Best drafted: {draft_points[i]:.1f} pts<br>"
-            f"Best actual: {actual_best_points[i]:.1f} pts<br>"
-            f"Difference: {diff_sign}{diff:.1f} pts"
-        )
-
+    # Add week-by-week hover data (invisible trace that only appears on hover).
+    # Only the numbers are shipped; player detail is loaded on demand (see
+    # create_week_detail)
     fig.add_trace(
-        go.Scatter(
+        scatter(
             x=draft_weeks,
             y=[0] * len(draft_weeks),  # Invisible points - doesn't matter where
             mode="markers",
             marker=dict(size=0, opacity=0),  # Invisible
-            hoverinfo="text",
-            hovertext=hover_text,
+            customdata=[
+                list(row) for row in zip(draft_points, actual_best_points, weekly_diffs)
+            ],
+            hovertemplate=(
+                "<b>Week %{x}</b><br>"
+                "Best drafted: %{customdata[0]:.1f} pts<br>"
+                "Best actual: %{customdata[1]:.1f} pts<br>"
+                "Difference: %{customdata[2]:+.1f} pts<extra></extra>"
+            ),
             showlegend=False,
             name="hover_data",
         )
@@ -490,7 +382,7 @@ def add_main_lines_lineup(
     """Adds main line traces for lineup comparison view"""
     # Add actual best roster line
     fig.add_trace(
-        go.Scatter(
+        scatter(
             x=actual_best_weeks,
             y=actual_best_points,
             mode="lines+markers",
@@ -498,14 +390,14 @@ def add_main_lines_lineup(
             line=dict(color="green", width=2),
             marker=dict(size=8),
             legendgroup="best",
-            legendgrouptitle_text="Best Possible Team Performance",
+            legendgrouptitle=dict(text="Best Possible Team Performance"),
             hoverinfo="skip",
         )
     )
 
     # Add actual lineup performance line
     fig.add_trace(
-        go.Scatter(
+        scatter(
             x=actual_lineup_weeks,
             y=actual_lineup_points,
             mode="lines+markers",
@@ -513,7 +405,7 @@ def add_main_lines_lineup(
             line=dict(color="orange", width=3),
             marker=dict(size=10),
             legendgroup="actual",
-            legendgrouptitle_text="Actual Team Performance",
+            legendgrouptitle=dict(text="Actual Team Performance"),
             hoverinfo="skip",
         )
     )
@@ -528,10 +420,13 @@ def add_fill_areas_lineup(
 ):
     """Adds fill areas for lineup comparison view"""
     # Fill between best actual and actual lineup with pattern (points left on bench)
+    (bench_x, bench_y), _ = fill_polygons(
+        actual_best_weeks, actual_best_points, actual_lineup_points
+    )
     fig.add_trace(
-        go.Scatter(
-            x=actual_best_weeks + actual_best_weeks[::-1],
-            y=actual_best_points + actual_lineup_points[::-1],
+        scatter(
+            x=bench_x.tolist(),
+            y=bench_y.tolist(),
             fill="toself",
             fillcolor="rgba(255, 0, 0, 0.2)",  # Transparent red
             line=dict(color="rgba(255,255,255,0)"),
@@ -544,7 +439,7 @@ def add_fill_areas_lineup(
 
     # Fill between actual lineup and zero (points achieved)
     fig.add_trace(
-        go.Scatter(
+        scatter(
             x=actual_lineup_weeks + actual_lineup_weeks[::-1],
             y=actual_lineup_points
             + [0] * len(actual_lineup_weeks),  # Bottom is zero line
@@ -565,7 +460,7 @@ def add_average_lines_lineup(
     """Adds average lines for lineup comparison view"""
     # Add horizontal average lines with hover text
     fig.add_trace(
-        go.Scatter(
+        scatter(
             x=[min(actual_best_weeks), max(actual_best_weeks)],
             y=[avg_actual_best, avg_actual_best],
             mode="lines",
@@ -573,13 +468,13 @@ def add_average_lines_lineup(
             name="Season average",
             hovertemplate="Best possible lineup average: %{y:.1f} pts<extra></extra>",
             legendgroup="best",
-            legendgrouptitle_text="Best Possible Team Performance",
+            legendgrouptitle=dict(text="Best Possible Team Performance"),
             showlegend=True,
         )
     )
 
     fig.add_trace(
-        go.Scatter(
+        scatter(
             x=[min(actual_lineup_weeks), max(actual_lineup_weeks)],
             y=[avg_actual_lineup, avg_actual_lineup],
             mode="lines",
@@ -587,7 +482,7 @@ def add_average_lines_lineup(
             name="Season average",
             hovertemplate="Actual lineup average: %{y:.1f} pts<extra></extra>",
             legendgroup="actual",
-            legendgrouptitle_text="Actual Team Performance",
+            legendgrouptitle=dict(text="Actual Team Performance"),
             showlegend=True,
         )
     )
@@ -602,24 +497,24 @@ def add_hover_data_lineup(
 ):
     """Adds hover data for lineup comparison view"""
     # Add week-by-week hover data (invisible trace that only appears on hover)
-    hover_text = []
-    for i, week in enumerate(actual_lineup_weeks):
-        pct = lineup_efficiency[i]
-        hover_text.append(
-            f"<b>Week {week}</b><br>"
-            f"Actual: {actual_lineup_points[i]:.1f} pts<br>"
-            f"Best possible: {actual_best_points[i]:.1f} pts<br>"
-            f"Efficiency: {pct:.1f}%"
-        )
-
     fig.add_trace(
-        go.Scatter(
+        scatter(
             x=actual_lineup_weeks,
             y=[0] * len(actual_lineup_weeks),  # Invisible points
             mode="markers",
             marker=dict(size=0, opacity=0),  # Invisible
-            hoverinfo="text",
-            hovertext=hover_text,
+            customdata=[
+                list(row)
+                for row in zip(
+                    actual_lineup_points, actual_best_points, lineup_efficiency
+                )
+            ],
+            hovertemplate=(
+                "<b>Week %{x}</b><br>"
+                "Actual: %{customdata[0]:.1f} pts<br>"
+                "Best possible: %{customdata[1]:.1f} pts<br>"
+                "Efficiency: %{customdata[2]:.1f}%<extra></extra>"
+            ),
             showlegend=False,
             name="hover_data",
         )
@@ -753,7 +648,7 @@ def apply_common_layout(fig, data, view_mode):
             spikethickness=1,
         ),
         yaxis=dict(
-            title="Points",
+            title=dict(text="Points"),
             side="left",
             range=[
                 data["y_min"],
@@ -763,8 +658,7 @@ def apply_common_layout(fig, data, view_mode):
         hovermode="x unified",
         hoverlabel=dict(
             bgcolor="white",
-            font_size=12,
-            font_family="Arial",
+            font=dict(size=12, family="Arial"),
             bordercolor="gray",
             namelength=-1,  # Show full trace name
         ),
@@ -1,8 +1,7 @@
-import numpy as np
 import logging
-import plotly.graph_objects as go
-from app.utils.data_fetcher import fetch_lineup_data
-from app.utils.data_processor import process_weekly_data
+from app.components.placeholders import create_unavailable_figure
+from app.utils.figure_builder import FigureBuilder, bar, split_figure
+from app.utils.season_model import load_season_summary
 
 logging.basicConfig(
     level=logging.INFO,
@@ -12,33 +11,25 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def create_season_waterfall(team_id, view_mode="all"):
+def create_season_waterfall(
+    team_id, view_mode="all", league_id=None, season=None, summary=None
+):
     """Creates the season performance waterfall chart with toggle options"""
     logger.info(
         f"Creating season overview for team {team_id} with view mode: {view_mode}"
     )
 
-    # Fetch data for all three scenarios
-    draft_data = fetch_lineup_data(
-        "leagues/47097656/teams/lineups/best-drafted", team_id
-    )
-    actual_best_data = fetch_lineup_data(
-        "leagues/47097656/teams/lineups/best-actual", team_id
-    )
-    actual_lineup_data = fetch_lineup_data(
-        "leagues/47097656/teams/lineups/actual", team_id
-    )
+    # Load the team's season summary for all three scenarios
+    if summary is None:
+        summary = load_season_summary(team_id, league_id, season)
+    if summary is None:
+        return create_unavailable_figure()
 
-    # Process data for all three scenarios
-    _, draft_points, _ = process_weekly_data(draft_data)
-    _, actual_best_points, _ = process_weekly_data(actual_best_data)
-    _, actual_lineup_points, _ = process_weekly_data(actual_lineup_data)
-
-    # Calculate averages and impacts
-    draft_points_avg = np.mean(draft_points)
-    actual_best_points_avg = np.mean(actual_best_points)
-    actual_lineup_points_avg = np.mean(actual_lineup_points)
-    transaction_impact = actual_best_points_avg - draft_points_avg
+    # Averages and impacts
+    draft_points_avg = summary.avg_draft
+    actual_best_points_avg = summary.avg_actual_best
+    actual_lineup_points_avg = summary.avg_actual_lineup
+    transaction_impact = summary.transaction_impact
 
     # Set bar colors
     colors = {
@@ -49,16 +40,12 @@ def create_season_waterfall(team_id, view_mode="all"):
         "missed": "rgba(241, 196, 15, 0.3)",  # Transparent yellow for unrealized
     }
 
-    # Calculate efficiency percentage
-    lineup_efficiency = (
-        (actual_lineup_points_avg / actual_best_points_avg * 100)
-        if actual_best_points_avg > 0
-        else 0
-    )
+    # Efficiency percentage
+    lineup_efficiency = summary.season_efficiency
     efficiency_text = f"{lineup_efficiency:.0f}% Efficient"
 
     # Create a figure with subplots for custom layout
-    fig = go.Figure()
+    fig = FigureBuilder()
 
     # Set x-positions and width
     x_positions = ["Draft Baseline", "Transactions", "Actual"]
@@ -66,11 +53,11 @@ def create_season_waterfall(team_id, view_mode="all"):
 
     # First bar: Draft Value
     fig.add_trace(
-        go.Bar(
+        bar(
             x=[x_positions[0]],
             y=[draft_points_avg],
             name="Draft Baseline",
-            marker_color=colors["draft"],
+            marker=dict(color=colors["draft"]),
             width=bar_width,
             text=f"{draft_points_avg:.1f}",
             textposition="outside",
@@ -83,11 +70,11 @@ def create_season_waterfall(team_id, view_mode="all"):
         colors["positive"] if transaction_impact > 0 else colors["negative"]
     )
     fig.add_trace(
-        go.Bar(
+        bar(
             x=[x_positions[1]],
             y=[abs(transaction_impact)],  # Use absolute value for bar height
             name="Transaction Impact",
-            marker_color=transaction_color,
+            marker=dict(color=transaction_color),
             width=bar_width,
             text=f"{transaction_impact:+.1f}",
             textposition="outside",
@@ -98,11 +85,11 @@ def create_season_waterfall(team_id, view_mode="all"):
 
     # Third bar: Actual Points (solid part)
     fig.add_trace(
-        go.Bar(
+        bar(
             x=[x_positions[2]],
             y=[actual_lineup_points_avg],
             name="Actual Points",
-            marker_color=colors["actual"],
+            marker=dict(color=colors["actual"]),
             width=bar_width,
             text=f"{actual_lineup_points_avg:.1f}",
             # textposition="outside",
@@ -113,7 +100,7 @@ def create_season_waterfall(team_id, view_mode="all"):
     # Fourth bar: Unrealized Potential (transparent extension)
     unrealized = actual_best_points_avg - actual_lineup_points_avg
     fig.add_trace(
-        go.Bar(
+        bar(
             x=[x_positions[2]],
             y=[unrealized],
             base=[actual_lineup_points_avg],  # Start from top of actual points
@@ -166,11 +153,11 @@ def create_season_waterfall(team_id, view_mode="all"):
         bargroupgap=0.1,
         plot_bgcolor="white",
         yaxis=dict(
-            title="Weekly Points Average",
+            title=dict(text="Weekly Points Average"),
             gridcolor="lightgray",
             zerolinecolor="lightgray",
         ),
-        xaxis=dict(title="", tickangle=0),
+        xaxis=dict(title=dict(text=""), tickangle=0),
         legend=dict(
             orientation="h",
             yanchor="bottom",
@@ -185,4 +172,18 @@ def create_season_waterfall(team_id, view_mode="all"):
         height=380,
     )
 
-    return fig
+    return fig.build()
+
+
+def split_season_waterfall(figure):
+    """
+    Splits a waterfall figure into its static frame and per-team series
+
+    Returns:
+        (frame, series) figure dicts (see split_figure)
+    """
+    return split_figure(
+        figure,
+        trace_keys=("y", "base", "text", "hovertemplate", "marker"),
+        layout_keys=("shapes",),
+    )
@@ -1,51 +1,24 @@
 import dash_bootstrap_components as dbc
 from dash import html
-from app.utils.data_fetcher import fetch_lineup_data
+from app.components.placeholders import create_unavailable_alert
+from app.utils.season_model import load_season_summary
 
 
-def create_season_summary_cards(team_id):
+def create_season_summary_cards(team_id, league_id=None, season=None, summary=None):
     """Creates the season summary cards with the performance breakdown path."""
-    draft_data = fetch_lineup_data(
-        "leagues/47097656/teams/lineups/best-drafted", team_id
-    )
-    actual_best_data = fetch_lineup_data(
-        "leagues/47097656/teams/lineups/best-actual", team_id
-    )
-    actual_lineup_data = fetch_lineup_data(
-        "leagues/47097656/teams/lineups/actual", team_id
-    )
-
-    draft_baseline = sum(
-        sum(player["points"] for pos in data["starters"].values() for player in pos)
-        for week, data in draft_data.items()
-    )
-
-    best_possible = sum(
-        sum(player["points"] for pos in data["starters"].values() for player in pos)
-        for week, data in actual_best_data.items()
-    )
-
-    actual_points = sum(
-        sum(player["points"] for pos in data["starters"].values() for player in pos)
-        for week, data in actual_lineup_data.items()
-    )
+    if summary is None:
+        summary = load_season_summary(team_id, league_id, season)
+    if summary is None:
+        return create_unavailable_alert()
 
-    # Count weeks for averaging
-    num_weeks = len(draft_data.keys())
+    # Weekly averages per scenario
+    draft_baseline = summary.avg_draft
+    best_possible = summary.avg_actual_best
+    actual_points = summary.avg_actual_lineup
 
-    # Convert to weekly averages if requested
-    draft_baseline /= num_weeks
-    best_possible /= num_weeks
-    actual_points /= num_weeks
-
-    # Calculate impacts
-    transaction_impact = best_possible - draft_baseline
-    lineup_impact = actual_points - best_possible
-
-    # Create efficiency percentage
-    lineup_efficiency = (
-        (actual_points / best_possible * 100) if best_possible > 0 else 0
-    )
+    # Impacts and efficiency percentage
+    transaction_impact = summary.transaction_impact
+    lineup_efficiency = summary.season_efficiency
 
     transaction_sign = "+" if transaction_impact > 0 else "-"
 
@@ -0,0 +1,148 @@
+from itertools import zip_longest
+from dash import html
+import dash_bootstrap_components as dbc
+import logging
+from app.utils.season_model import load_season_model
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+def create_week_detail(
+    team_id,
+    week,
+    view_mode="roster_comparison",
+    league_id=None,
+    season=None,
+    model=None,
+):
+    """
+    Creates the player-level breakdown of one week shown under the overview chart
+
+    Starters are aligned by slot, followed by both lineups' bench players.
+
+    Args:
+        team_id: The team ID to show
+        week: The week to show
+        view_mode: Either "roster_comparison" (drafted vs. actual roster) or
+            "lineup_comparison" (actual vs. best possible lineup)
+        league_id: League to show (defaults to Config.default_league_id)
+        season: Season to show (defaults to Config.default_season)
+        model: The team's SeasonModel, if already loaded
+
+    Returns:
+        A Dash component
+    """
+    logger.info(f"Creating week {week} detail for team {team_id} ({view_mode})")
+
+    if model is None:
+        model = load_season_model(team_id, league_id, season)
+    comparison = None if model is None else model.week_comparison(week)
+    if comparison is None:
+        return html.P(
+            f"Week {week} details are not available.",
+            className="text-muted small mb-0",
+        )
+
+    if view_mode == "roster_comparison":
+        headers = ["Position", "Best Drafted", "Points", "Best Actual", "Points"]
+        columns = [
+            comparison.positions,
+            comparison.drafted_names,
+            comparison.drafted_points,
+            comparison.best_names,
+            comparison.best_points,
+        ]
+        bench_headers = ["Best Drafted Bench", "Points", "Best Actual Bench", "Points"]
+        benches = (comparison.drafted_bench, comparison.best_bench)
+        summary = (
+            f"Best drafted: {comparison.draft_total:.1f} pts · "
+            f"Best actual: {comparison.best_total:.1f} pts · "
+            f"Difference: {comparison.best_total - comparison.draft_total:+.1f} pts"
+        )
+    else:
+        headers = ["Position", "Actual Starter", "Points", "Best Possible", "Points"]
+        columns = [
+            comparison.positions,
+            comparison.actual_names,
+            comparison.actual_points,
+            comparison.best_names,
+            comparison.best_points,
+        ]
+        bench_headers = ["Actual Bench", "Points", "Best Possible Bench", "Points"]
+        benches = (comparison.actual_bench, comparison.best_bench)
+        summary = (
+            f"Actual: {comparison.actual_total:.1f} pts · "
+            f"Best possible: {comparison.best_total:.1f} pts · "
+            f"Left on bench: {comparison.best_total - comparison.actual_total:.1f} pts"
+        )
+
+    rows = []
+    for position, name, points, other_name, other_points in zip(*columns):
+        # Highlight slots where the two lineups started different players
+        changed = name != other_name
+        rows.append(
+            html.Tr(
+                [
+                    html.Td(position),
+                    html.Td(name or "-"),
+                    html.Td(f"{points:.1f}"),
+                    html.Td(name_cell(other_name, changed)),
+                    html.Td(f"{other_points:.1f}"),
+                ]
+            )
+        )
+
+    return html.Div(
+        [
+            html.H6(f"Week {week} Breakdown", className="mb-1"),
+            html.P(summary, className="text-muted small mb-2"),
+            detail_table(headers, rows),
+            detail_table(bench_headers, bench_rows(*benches)),
+        ]
+    )
+
+
+def detail_table(headers, rows):
+    """Returns a compact table with a header row"""
+    return dbc.Table(
+        [
+            html.Thead(html.Tr([html.Th(header) for header in headers])),
+            html.Tbody(rows),
+        ],
+        bordered=False,
+        hover=True,
+        size="sm",
+        className="mb-2",
+    )
+
+
+def bench_rows(bench, other_bench):
+    """Returns table rows pairing two benches' players side by side"""
+    rows = []
+    for player, other_player in zip_longest(bench, other_bench):
+        cells = []
+        for bench_player in (player, other_player):
+            if bench_player is None:
+                cells += [html.Td("-"), html.Td("")]
+            else:
+                cells += [
+                    html.Td(f"{bench_player.name} ({bench_player.position})"),
+                    html.Td(f"{bench_player.points:.1f}"),
+                ]
+        rows.append(html.Tr(cells))
+    if not rows:
+        rows.append(html.Tr(html.Td("No bench players", colSpan=4)))
+    return rows
+
+
+def name_cell(name, changed):
+    """Returns a player name, bold if it differs from the other lineup"""
+    if not name:
+        return "-"
+    return html.Strong(name) if changed else name
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -8,5 +9,94 @@ load_dotenv()
 class Config:
     backend_url = os.getenv("BACKEND_URL", "http://localhost:8000")
 
+    # Serve lineups from this snapshot file instead of the backend, if set
+    snapshot_path = os.getenv("LINEUP_SNAPSHOT") or None
+
+    # League and season shown by default; callers can ask for any other
+    default_league_id = os.getenv("LEAGUE_ID", "47097656")
+    default_season = int(os.getenv("SEASON", 2024))
+
+    # Teams in the league, as shown in the team dropdown
+    league_team_ids = list(range(1, int(os.getenv("LEAGUE_TEAM_COUNT", 10)) + 1))
+
+    # Pooled HTTP client settings for backend requests
+    http_pool_size = int(os.getenv("HTTP_POOL_SIZE", 10))
+    http_connect_timeout = float(os.getenv("HTTP_CONNECT_TIMEOUT", 3.05))
+    http_read_timeout = float(os.getenv("HTTP_READ_TIMEOUT", 10))
+    http_max_retries = int(os.getenv("HTTP_MAX_RETRIES", 3))
+    http_retry_budget = float(os.getenv("HTTP_RETRY_BUDGET", 15))  # Seconds
+    http_backoff_base = float(os.getenv("HTTP_BACKOFF_BASE", 0.25))  # Seconds
+
+    # Worker threads used to fetch lineup endpoints concurrently
+    fetch_workers = int(os.getenv("FETCH_WORKERS", 8))
+
+    # Ask the backend for weekly totals only (?fields=totals) when the charts
+    # don't need player detail; otherwise totals are reduced on arrival
+    totals_projection = (
+        os.getenv("BACKEND_TOTALS_PROJECTION", "false").lower() == "true"
+    )
+
+    # Circuit breaker per backend endpoint, and how long (seconds) a failed
+    # fetch is remembered before the same request is tried again
+    breaker_failure_threshold = int(os.getenv("BREAKER_FAILURE_THRESHOLD", 5))
+    breaker_reset_timeout = float(os.getenv("BREAKER_RESET_TIMEOUT", 30))
+    negative_cache_ttl = float(os.getenv("NEGATIVE_CACHE_TTL", 10))
+
+    # Background cache prewarm at startup and every prewarm_interval seconds
+    # (0 = startup only), making prewarm_concurrency backend requests at a
+    # time on its own pool, so the fetch pool stays free for page loads
+    prewarm_enabled = os.getenv("PREWARM_ENABLED", "true").lower() == "true"
+    prewarm_interval = float(os.getenv("PREWARM_INTERVAL", 900))
+    prewarm_concurrency = int(os.getenv("PREWARM_CONCURRENCY", 2))
+
+    # Response cache backend: "memory" (per process) or "shared" (per host)
+    cache_backend = os.getenv("CACHE_BACKEND", "memory")
+    shared_cache_path = os.getenv(
+        "SHARED_CACHE_PATH",
+        os.path.join(tempfile.gettempdir(), "ffwrapped_cache.sqlite3"),
+    )
+
+    # Response cache bounds and time-to-live (seconds) per lineup endpoint
+    cache_max_entries = int(os.getenv("CACHE_MAX_ENTRIES", 500))
+    cache_max_bytes = int(os.getenv("CACHE_MAX_BYTES", 64 * 1024 * 1024))
+    cache_default_ttl = float(os.getenv("CACHE_TTL", 900))
+    cache_endpoint_ttls = {
+        # The drafted roster never changes once the draft is done
+        "best-drafted": float(os.getenv("CACHE_TTL_BEST_DRAFTED", 86400)),
+        "best-actual": float(os.getenv("CACHE_TTL_BEST_ACTUAL", 900)),
+        "actual": float(os.getenv("CACHE_TTL_ACTUAL", 900)),
+    }
+
+    # Build season charts as plain figure dicts, skipping plotly's per-property
+    # validation (set to false to build validated go.Figure objects instead)
+    fast_figures = os.getenv("FAST_FIGURES", "true").lower() == "true"
+
+    # Rendered figures/components per (inputs, data version), so repeated
+    # views skip all Plotly work
+    figure_cache_max_entries = int(os.getenv("FIGURE_CACHE_MAX_ENTRIES", 256))
+    figure_cache_max_bytes = int(os.getenv("FIGURE_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+    figure_cache_ttl = float(os.getenv("FIGURE_CACHE_TTL", 3600))
+
+    # Per-partition (league/season) quotas, so one league's working set
+    # cannot evict another's
+    cache_partition_max_entries = int(os.getenv("CACHE_PARTITION_MAX_ENTRIES", 150))
+    cache_partition_max_bytes = int(
+        os.getenv("CACHE_PARTITION_MAX_BYTES", 16 * 1024 * 1024)
+    )
+
+    # Refresh stale lineups by fetching only the latest cached week and later
+    # ones (?fromWeek=N), merging them instead of re-fetching the whole season
+    incremental_refresh = os.getenv("INCREMENTAL_REFRESH", "true").lower() == "true"
+    # Seconds between full (conditional) refetches, which pick up stat
+    # corrections to earlier weeks
+    full_refresh_interval = float(os.getenv("FULL_REFRESH_INTERVAL", 3600))
+
+    # Expired entries are kept this many more seconds and revalidated with
+    # conditional GETs; with stale-while-revalidate they are served meanwhile
+    cache_stale_ttl = float(os.getenv("CACHE_STALE_TTL", 3600))
+    stale_while_revalidate = (
+        os.getenv("STALE_WHILE_REVALIDATE", "true").lower() == "true"
+    )
+
 
 config = Config()
@@ -1,5 +1,6 @@
 import dash_bootstrap_components as dbc
 from dash import html
+from flask import jsonify
 
 from app.app import app
 from app.layouts.tab1_layout import get_tab1_layout
@@ -37,7 +38,27 @@ app.layout = dbc.Container(
     className="p-4",
 )
 
-from app.callbacks import tab1_callbacks
+from app.callbacks import tab1_callbacks, tab3_callbacks
+from app.utils import figure_cache, prewarm
+from app.utils.data_fetcher import fetch_stats
+
+# Warm the lineup cache in the background before taking traffic
+prewarm.start()
+
+
+@app.server.route("/ready")
+def readiness():
+    """Readiness probe: 200 once the cache is warm, 503 while still warming"""
+    if prewarm.is_ready():
+        return "ready", 200
+    return "warming", 503
+
+
+@app.server.route("/stats")
+def cache_stats():
+    """Lineup fetch and rendered-figure cache counters, as JSON"""
+    return jsonify(fetch=fetch_stats(), figures=figure_cache.stats())
+
 
 if __name__ == "__main__":
     app.run_server(debug=True)
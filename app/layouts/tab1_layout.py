@@ -1,11 +1,25 @@
 from dash import html, dcc
 import dash_bootstrap_components as dbc
+from app.config import config
 
 
 def get_tab1_layout():
     """Layout for Tab 1: Season Performance Overview."""
     return dbc.Container(
         [
+            # League and season the dashboard shows
+            dcc.Store(
+                id="league-settings",
+                data={
+                    "league_id": config.default_league_id,
+                    "season": config.default_season,
+                },
+            ),
+            # Season charts, kept in the browser as static frames (sent once)
+            # plus the selected team's series for both overview views
+            dcc.Store(id="season-chart-frames"),
+            dcc.Store(id="season-overview-store"),
+            dcc.Store(id="season-waterfall-store"),
             # Dashboard Header with Team Selector
             dbc.Row(
                 [
@@ -31,7 +45,7 @@ def get_tab1_layout():
                                                             "label": f"Team {i}",
                                                             "value": i,
                                                         }
-                                                        for i in range(1, 11)
+                                                        for i in config.league_team_ids
                                                     ],
                                                     value=1,
                                                     clearable=False,
@@ -221,6 +235,11 @@ def get_tab1_layout():
                                     ),
                                 )
                             ),
+                            # Breakdown of the hovered or clicked week
+                            dbc.CardFooter(
+                                html.Div(id="season-week-detail"),
+                                className="bg-white",
+                            ),
                         ],
                         className="mb-4 shadow-sm",
                     ),
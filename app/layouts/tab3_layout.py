@@ -8,15 +8,14 @@ def get_tab3_layout():
     """
     return dbc.Container(
         [
-            html.H2("Coming soon!"),
-            html.P("====================================="),
-            html.P("====================================="),
-            html.P("====================================="),
             html.H3("League-Wide Breakdown", className="mt-4"),
             html.P(
-                "Illustrate multiple teams (1–10) over weeks (1–18), using line charts."
+                "Compare every team's weekly points against the league average, "
+                "and see how drafts, transactions and lineup decisions shaped each "
+                "team's season.",
+                className="text-muted",
             ),
-            # Example placeholders for the three line charts
+            # Every team's weekly points per scenario, ranked by season average
             dcc.Graph(id="league-drafted-overview-graph"),
             dcc.Graph(id="league-actual-overview-graph"),
             dcc.Graph(id="league-selected-overview-graph"),
@@ -0,0 +1,595 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+def estimate_size(value):
+    """Estimates the memory footprint of a JSON payload by its compact encoded length"""
+    return len(json.dumps(value, separators=(",", ":")))
+
+
+def serialize(value):
+    """Encodes a JSON payload as compact, zlib-compressed bytes"""
+    return zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+
+def deserialize(blob):
+    """Decodes bytes produced by serialize() back into a JSON payload"""
+    return json.loads(zlib.decompress(blob))
+
+
+class CacheEntry:
+    """
+    A cached value with its size, freshness deadlines and metadata
+
+    An entry is fresh until expires_at, then stale (still readable through
+    get_entry, e.g. for revalidation) until stale_until, after which it is
+    dropped. meta holds small response details such as ETag/Last-Modified,
+    and partition names the tenant (e.g. league/season) the entry belongs to.
+    """
+
+    __slots__ = ("value", "size", "expires_at", "stale_until", "meta", "partition")
+
+    def __init__(self, value, size, expires_at, stale_until, meta, partition):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+        self.meta = meta
+        self.partition = partition
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache with per-entry TTLs, bounded by entry count and bytes
+
+    Entries belong to a partition (one per tenant, e.g. league/season), and
+    each partition can have its own entry/byte quota. Storing into a
+    partition over its quota evicts that partition's least-recently-used
+    entries; when the whole cache is over its bounds, entries are evicted
+    from the largest partition first, so one tenant's working set cannot push
+    out another's. Entries past their TTL are kept as stale for stale_ttl
+    more seconds and dropped when read after that.
+    """
+
+    def __init__(
+        self,
+        max_entries,
+        max_bytes,
+        default_ttl,
+        stale_ttl=0,
+        partition_max_entries=None,
+        partition_max_bytes=None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.partition_max_entries = partition_max_entries or max_entries
+        self.partition_max_bytes = partition_max_bytes or max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        # Keys of each partition in LRU order, and each partition's bytes
+        self._partitions = {}
+        self._partition_bytes = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key):
+        """Returns the cached value for key, or None if missing or not fresh"""
+        entry = self.get_entry(key)
+        if entry is None or not entry[2]:
+            return None
+        return entry[0]
+
+    def get_entry(self, key):
+        """
+        Looks up key including stale entries
+
+        Returns:
+            A (value, meta, is_fresh) tuple, or None if missing or past its
+            stale window
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.stale_until <= now:
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._partitions[entry.partition].move_to_end(key)
+            is_fresh = entry.expires_at > now
+            if is_fresh:
+                self._hits += 1
+            else:
+                self._stale_hits += 1
+            return entry.value, entry.meta, is_fresh
+
+    def peek(self, key):
+        """
+        Looks up key like get_entry, without counting it or refreshing its recency
+
+        For internal re-checks of a key that was already looked up.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.stale_until <= now:
+                return None
+            return entry.value, entry.meta, entry.expires_at > now
+
+    def set(self, key, value, ttl=None, meta=None, partition=""):
+        """Stores value (and optional meta dict) under key in a partition for ttl seconds"""
+        size = estimate_size(value)
+        if size > min(self.max_bytes, self.partition_max_bytes):
+            logger.warning(f"Not caching {key}: {size} bytes exceeds cache limit")
+            return
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = CacheEntry(
+                value,
+                size,
+                expires_at,
+                expires_at + self.stale_ttl,
+                meta or {},
+                partition,
+            )
+            self._partitions.setdefault(partition, OrderedDict())[key] = None
+            self._partition_bytes[partition] = (
+                self._partition_bytes.get(partition, 0) + size
+            )
+            self._bytes += size
+
+            # Enforce the partition's quota first, then the cache-wide bounds
+            while (
+                len(self._partitions[partition]) > self.partition_max_entries
+                or self._partition_bytes[partition] > self.partition_max_bytes
+            ):
+                self._evict_from(partition)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                largest = max(self._partition_bytes, key=self._partition_bytes.get)
+                self._evict_from(largest)
+
+    def touch(self, key, ttl=None):
+        """Marks an existing entry fresh for another ttl seconds (e.g. after a 304)"""
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.expires_at = expires_at
+                entry.stale_until = expires_at + self.stale_ttl
+
+    def delete(self, key):
+        """Removes key from the cache if present"""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        """Removes every entry from the cache"""
+        with self._lock:
+            self._entries.clear()
+            self._partitions.clear()
+            self._partition_bytes.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """Returns hit/miss/eviction counters and current usage"""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "stale_hits": self._stale_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "partitions": {
+                    partition: {
+                        "entries": len(keys),
+                        "bytes": self._partition_bytes[partition],
+                    }
+                    for partition, keys in self._partitions.items()
+                },
+            }
+
+    def __contains__(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry.expires_at > time.monotonic()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def _remove(self, key):
+        """Drops key and its size from the accounting; caller holds the lock"""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        partition_keys = self._partitions[entry.partition]
+        del partition_keys[key]
+        if partition_keys:
+            self._partition_bytes[entry.partition] -= entry.size
+        else:
+            del self._partitions[entry.partition]
+            del self._partition_bytes[entry.partition]
+
+    def _evict_from(self, partition):
+        """Evicts a partition's least-recently-used entry; caller holds the lock"""
+        self._remove(next(iter(self._partitions[partition])))
+        self._evictions += 1
+
+
+class SharedCache:
+    """
+    Cross-process cache stored in a SQLite database in WAL mode
+
+    Every worker process on the host that points at the same path shares the
+    same entries, so a payload fetched by one worker is a hit for the others.
+    Values are stored compressed. Bounds, per-partition quotas, eviction order
+    and stale entries work as in ResponseCache, using the least recently
+    accessed entries. Hit/miss counters are per process.
+
+    Database errors (e.g. a write lock held past the busy timeout) are logged
+    and treated as a miss or a skipped write rather than raised.
+    """
+
+    # Bump when the table layout changes; older cache files are rebuilt
+    SCHEMA_VERSION = 3
+
+    # Seconds an entry's access time may lag behind, so most hits only read
+    ACCESS_RESOLUTION = 60
+
+    def __init__(
+        self,
+        path,
+        max_entries,
+        max_bytes,
+        default_ttl,
+        stale_ttl=0,
+        partition_max_entries=None,
+        partition_max_bytes=None,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.partition_max_entries = partition_max_entries or max_entries
+        self.partition_max_bytes = partition_max_bytes or max_bytes
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+        conn = self._connection()
+        with conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS cache")
+                conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+                "expires_at REAL NOT NULL, stale_until REAL NOT NULL, "
+                "accessed_at REAL NOT NULL, meta TEXT NOT NULL, "
+                "partition_key TEXT NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_partition_accessed_at "
+                "ON cache (partition_key, accessed_at)"
+            )
+
+    def _connection(self):
+        """Returns this thread's connection to the cache database"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, counter, amount=1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def get(self, key):
+        """Returns the cached value for key, or None if missing or not fresh"""
+        entry = self.get_entry(key)
+        if entry is None or not entry[2]:
+            return None
+        return entry[0]
+
+    def get_entry(self, key):
+        """
+        Looks up key including stale entries
+
+        Returns:
+            A (value, meta, is_fresh) tuple, or None if missing or past its
+            stale window
+        """
+        try:
+            return self._get_entry(key)
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache lookup of {key} failed: {e}")
+            self._count("_misses")
+            return None
+
+    def _get_entry(self, key):
+        """get_entry() without the database error handling"""
+        now = time.time()
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT value, expires_at, stale_until, accessed_at, meta FROM cache "
+            "WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            self._count("_misses")
+            return None
+        value, expires_at, stale_until, accessed_at, meta = row
+        if stale_until <= now:
+            with conn:
+                conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._count("_expirations")
+            self._count("_misses")
+            return None
+        if now - accessed_at >= self.ACCESS_RESOLUTION:
+            try:
+                with conn:
+                    conn.execute(
+                        "UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key)
+                    )
+            except sqlite3.Error as e:
+                # Only the eviction order suffers; the hit is still good
+                logger.warning(f"Shared cache access time of {key} not updated: {e}")
+        is_fresh = expires_at > now
+        self._count("_hits" if is_fresh else "_stale_hits")
+        return deserialize(value), json.loads(meta), is_fresh
+
+    def peek(self, key):
+        """
+        Looks up key like get_entry, without counting it or updating its access time
+
+        For internal re-checks of a key that was already looked up.
+        """
+        now = time.time()
+        try:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT value, expires_at, meta FROM cache "
+                    "WHERE key = ? AND stale_until > ?",
+                    (key, now),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache lookup of {key} failed: {e}")
+            return None
+        if row is None:
+            return None
+        value, expires_at, meta = row
+        return deserialize(value), json.loads(meta), expires_at > now
+
+    def set(self, key, value, ttl=None, meta=None, partition=""):
+        """Stores value (and optional meta dict) under key in a partition for ttl seconds"""
+        blob = serialize(value)
+        if len(blob) > min(self.max_bytes, self.partition_max_bytes):
+            logger.warning(f"Not caching {key}: {len(blob)} bytes exceeds cache limit")
+            return
+        ttl = self.default_ttl if ttl is None else ttl
+        try:
+            self._set(key, blob, ttl, meta, partition)
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache write of {key} failed: {e}")
+
+    def _set(self, key, blob, ttl, meta, partition):
+        """set() without the size check and database error handling"""
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, size, expires_at, "
+                "stale_until, accessed_at, meta, partition_key) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    blob,
+                    len(blob),
+                    now + ttl,
+                    now + ttl + self.stale_ttl,
+                    now,
+                    json.dumps(meta or {}),
+                    partition,
+                ),
+            )
+            expired = conn.execute(
+                "DELETE FROM cache WHERE stale_until <= ?", (now,)
+            ).rowcount
+
+            # Enforce the partition's quota first, then the cache-wide bounds
+            evicted = 0
+            while True:
+                count, total = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache "
+                    "WHERE partition_key = ?",
+                    (partition,),
+                ).fetchone()
+                if (
+                    count <= self.partition_max_entries
+                    and total <= self.partition_max_bytes
+                ):
+                    break
+                evicted += self._evict_from(conn, partition)
+            while True:
+                count, total = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache"
+                ).fetchone()
+                if count <= self.max_entries and total <= self.max_bytes:
+                    break
+                largest = conn.execute(
+                    "SELECT partition_key FROM cache GROUP BY partition_key "
+                    "ORDER BY SUM(size) DESC LIMIT 1"
+                ).fetchone()[0]
+                evicted += self._evict_from(conn, largest)
+        self._count("_expirations", expired)
+        self._count("_evictions", evicted)
+
+    @staticmethod
+    def _evict_from(conn, partition):
+        """Deletes a partition's least recently accessed entry, returning the rows deleted"""
+        return conn.execute(
+            "DELETE FROM cache WHERE key = (SELECT key FROM cache "
+            "WHERE partition_key = ? ORDER BY accessed_at LIMIT 1)",
+            (partition,),
+        ).rowcount
+
+    def touch(self, key, ttl=None):
+        """Marks an existing entry fresh for another ttl seconds (e.g. after a 304)"""
+        ttl = self.default_ttl if ttl is None else ttl
+        now = time.time()
+        conn = self._connection()
+        try:
+            with conn:
+                conn.execute(
+                    "UPDATE cache SET expires_at = ?, stale_until = ? WHERE key = ?",
+                    (now + ttl, now + ttl + self.stale_ttl, key),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache touch of {key} failed: {e}")
+
+    def delete(self, key):
+        """Removes key from the cache if present"""
+        conn = self._connection()
+        try:
+            with conn:
+                conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache delete of {key} failed: {e}")
+
+    def clear(self):
+        """Removes every entry from the cache"""
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM cache")
+
+    def stats(self):
+        """Returns hit/miss/eviction counters and current usage"""
+        rows = (
+            self._connection()
+            .execute(
+                "SELECT partition_key, COUNT(*), SUM(size) FROM cache "
+                "GROUP BY partition_key"
+            )
+            .fetchall()
+        )
+        partitions = {
+            partition: {"entries": count, "bytes": total}
+            for partition, count, total in rows
+        }
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "stale_hits": self._stale_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "entries": sum(usage["entries"] for usage in partitions.values()),
+                "bytes": sum(usage["bytes"] for usage in partitions.values()),
+                "partitions": partitions,
+            }
+
+    def __contains__(self, key):
+        row = (
+            self._connection()
+            .execute(
+                "SELECT 1 FROM cache WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+        return row is not None
+
+    def __len__(self):
+        return self._connection().execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+
+def create_cache(
+    backend,
+    max_entries,
+    max_bytes,
+    default_ttl,
+    stale_ttl=0,
+    partition_max_entries=None,
+    partition_max_bytes=None,
+    path=None,
+):
+    """
+    Creates the response cache for the configured backend
+
+    Args:
+        backend: "memory" for a per-process ResponseCache, or "shared" for a
+            SharedCache at path that all processes on the host can use
+        max_entries: Maximum number of cached entries
+        max_bytes: Maximum total size of cached entries
+        default_ttl: TTL in seconds for entries stored without one
+        stale_ttl: Seconds an expired entry is kept for revalidation
+        partition_max_entries: Maximum entries per partition (default max_entries)
+        partition_max_bytes: Maximum bytes per partition (default max_bytes)
+        path: SQLite database path for the shared backend
+
+    Returns:
+        A cache object exposing get/get_entry/peek/set/touch/delete/clear/stats
+    """
+    if backend == "shared":
+        logger.info(f"Using shared response cache at {path}")
+        return SharedCache(
+            path,
+            max_entries,
+            max_bytes,
+            default_ttl,
+            stale_ttl,
+            partition_max_entries,
+            partition_max_bytes,
+        )
+    if backend != "memory":
+        raise ValueError(f"Unknown cache backend: {backend}")
+    return ResponseCache(
+        max_entries,
+        max_bytes,
+        default_ttl,
+        stale_ttl,
+        partition_max_entries,
+        partition_max_bytes,
+    )
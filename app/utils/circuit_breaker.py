@@ -0,0 +1,79 @@
+import logging
+import threading
+import time
+
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class BackendUnavailable(Exception):
+    """Raised instead of calling a backend that is known to be failing"""
+
+
+class CircuitBreaker:
+    """
+    Stops calling a failing backend until a probe shows it has recovered
+
+    After failure_threshold consecutive failures the circuit opens and calls
+    are rejected. Once reset_timeout seconds have passed, a single probe call
+    is let through (half-open): success closes the circuit, failure re-opens
+    it for another reset_timeout.
+    """
+
+    def __init__(self, name, failure_threshold, reset_timeout):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state
+
+    def allow(self):
+        """Returns True if a call may go ahead (claiming the probe when half-open)"""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if (
+                self._state == OPEN
+                and time.monotonic() - self._opened_at >= self.reset_timeout
+            ):
+                self._state = HALF_OPEN
+                logger.info(f"Circuit for {self.name} half-open, probing")
+                return True
+            return False
+
+    def record_success(self):
+        """Records a successful call, closing the circuit"""
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info(f"Circuit for {self.name} closed")
+            self._state = CLOSED
+            self._failures = 0
+
+    def record_failure(self):
+        """Records a failed call, opening the circuit if the threshold is reached"""
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    logger.warning(
+                        f"Circuit for {self.name} opened after {self._failures} failures"
+                    )
+                self._state = OPEN
+                self._opened_at = time.monotonic()
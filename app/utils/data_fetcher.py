@@ -1,6 +1,20 @@
 import requests
+import json
 import logging
+import threading
+import time
+import zlib
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from app.config import config
+from app.utils import http_client
+from app.utils.cache import ResponseCache, create_cache
+from app.utils.circuit_breaker import BackendUnavailable, CircuitBreaker
+from app.utils.data_processor import weekly_totals
+from app.utils.json_stream import CHUNK_SIZE, ChunkReader, iter_object_items
+from app.utils.schema import decode_lineups, decode_totals
+from app.utils.singleflight import SingleFlight
+from app.utils.snapshot import Snapshot, SnapshotError
 
 
 # Set up logging
@@ -14,27 +28,622 @@ logger = logging.getLogger(__name__)
 # FastAPI backend URL
 BASE_URL = config.backend_url
 
+# Lineup endpoints needed for every team, keyed by scenario
+LINEUP_ENDPOINTS = {
+    "draft": "best-drafted",
+    "actual_best": "best-actual",
+    "actual_lineup": "actual",
+}
+
+# Errors a lineup fetch can raise: backend/network errors, a backend known to
+# be failing, a missing snapshot payload, or a malformed response body
+FETCH_ERRORS = (
+    requests.exceptions.RequestException,
+    BackendUnavailable,
+    SnapshotError,
+    ValueError,
+)
+
+# Offline snapshot to serve lineups from instead of the backend, if configured
+snapshot = Snapshot(config.snapshot_path) if config.snapshot_path else None
+if snapshot is not None:
+    logger.info(f"Serving lineup data from snapshot {config.snapshot_path}")
+
 # Cache for API responses to minimize backend calls
-response_cache = {}
+response_cache = create_cache(
+    config.cache_backend,
+    max_entries=config.cache_max_entries,
+    max_bytes=config.cache_max_bytes,
+    default_ttl=config.cache_default_ttl,
+    stale_ttl=config.cache_stale_ttl,
+    partition_max_entries=config.cache_partition_max_entries,
+    partition_max_bytes=config.cache_partition_max_bytes,
+    path=config.shared_cache_path,
+)
+
+# Recently failed fetches, so retries wait out a short window instead of
+# every caller hitting a failing backend again
+_negative_cache = ResponseCache(
+    max_entries=config.cache_max_entries,
+    max_bytes=config.cache_max_bytes,
+    default_ttl=config.negative_cache_ttl,
+)
+
+# Circuit breakers per (backend, endpoint)
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+# Merges concurrent fetches of the same payload into one backend call
+_inflight = SingleFlight()
+
+# Decoded Week/WeekTotal records per cache key, reused while the payload version holds
+_decoded = OrderedDict()
+_decoded_lock = threading.Lock()
+
+# Cache keys that already have a background refresh scheduled
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+# Worker pool used to fan out backend requests concurrently
+_executor = ThreadPoolExecutor(
+    max_workers=config.fetch_workers, thread_name_prefix="lineup-fetch"
+)
+
+
+# Fetch modes: "full" payloads carry every player, "totals" payloads only
+# map each week to the starters' total points (enough for the season charts)
+FULL = "full"
+TOTALS = "totals"
+
+
+class LineupRequest(
+    namedtuple(
+        "LineupRequest",
+        ["league_id", "season", "endpoint", "team_id", "mode"],
+        defaults=(FULL,),
+    )
+):
+    """Identifies one lineup payload: an endpoint for one team in a league season"""
+
+    __slots__ = ()
+
+    @property
+    def path(self):
+        """Backend path of the endpoint"""
+        return f"leagues/{self.league_id}/teams/lineups/{self.endpoint}"
+
+    @property
+    def params(self):
+        """Backend query parameters"""
+        params = {"teamId": self.team_id, "season": self.season}
+        if self.mode == TOTALS and config.totals_projection:
+            params["fields"] = "totals"
+        return params
+
+    @property
+    def partition(self):
+        """Cache partition (one per league season)"""
+        return f"{self.league_id}/{self.season}"
+
+    @property
+    def cache_key(self):
+        """Cache key, unique across leagues, seasons and fetch modes"""
+        key = f"{self.partition}/{self.endpoint}_{self.team_id}"
+        return key if self.mode == FULL else f"{key}:{self.mode}"
+
+    def full(self):
+        """Returns the request for the full payload this request derives from"""
+        return self._replace(mode=FULL)
+
+
+def resolve_league(league_id=None, season=None):
+    """Fills in the configured default league and season where not given"""
+    return (
+        config.default_league_id if league_id is None else league_id,
+        config.default_season if season is None else season,
+    )
+
+
+def cache_ttl_for(endpoint):
+    """Returns the cache TTL configured for an endpoint"""
+    return config.cache_endpoint_ttls.get(endpoint, config.cache_default_ttl)
+
 
+def payload_version(data):
+    """Returns a short content digest identifying one version of a payload"""
+    encoded = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    return f"{zlib.crc32(encoded):08x}"
 
-# Method to fetch data
-def fetch_lineup_data(endpoint, team_id):
-    """Fetches lineup data for a given team with caching"""
-    cache_key = f"{endpoint}_{team_id}"
 
-    if cache_key in response_cache:
-        logger.info(f"Using cached data for {endpoint}, team {team_id}")
-        return response_cache[cache_key]
+def _load_lineup_entry(request, executor=None):
+    """
+    Returns a LineupRequest's data from the cache or the backend, raising on fetch errors
+
+    A stale entry's background refresh runs on executor (the fetch pool by
+    default).
+
+    Returns:
+        A (data, meta) tuple, where meta["version"] identifies the payload
+    """
+    cache_key = request.cache_key
+
+    entry = response_cache.get_entry(cache_key)
+    if entry is not None:
+        data, meta, is_fresh = entry
+        if is_fresh:
+            logger.info(f"Using cached data for {request.path}, team {request.team_id}")
+            return data, meta
+        if config.stale_while_revalidate:
+            logger.info(
+                f"Serving stale data for {request.path}, team {request.team_id}"
+            )
+            _schedule_refresh(request, executor)
+            return data, meta
+
+    failure = _negative_cache.get(cache_key)
+    if failure is not None:
+        raise BackendUnavailable(failure)
+
+    try:
+        return _inflight.do(cache_key, _fetch_and_cache, request)
+    except FETCH_ERRORS as e:
+        _negative_cache.set(cache_key, str(e), partition=request.partition)
+        raise
+
+
+def _breaker_for(endpoint):
+    """Returns the circuit breaker for an endpoint on the configured backend"""
+    name = f"{BASE_URL}/leagues/*/teams/lineups/{endpoint}"
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name,
+                failure_threshold=config.breaker_failure_threshold,
+                reset_timeout=config.breaker_reset_timeout,
+            )
+            _breakers[name] = breaker
+        return breaker
+
+
+def _is_backend_failure(error):
+    """Returns True for errors that mean the backend is unhealthy (not e.g. a 404)"""
+    response = getattr(error, "response", None)
+    if response is None:
+        return True
+    return response.status_code >= 500 or response.status_code == 429
+
+
+def _call_backend(endpoint, fn, *args):
+    """Runs fn(*args) through the endpoint's circuit breaker"""
+    breaker = _breaker_for(endpoint)
+    if not breaker.allow():
+        raise BackendUnavailable(f"Backend circuit open for {endpoint}")
 
-    logger.info(f"Fetching data from {endpoint} for team {team_id}")
-    url = f"{BASE_URL}/{endpoint}?teamId={team_id}"
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        response_cache[cache_key] = data
-        return data
+        result = fn(*args)
     except requests.exceptions.RequestException as e:
-        logger.error(f"Error fetching data from {endpoint}: {e}")
-        return {}
+        # A client error (e.g. a 404) still means the backend is answering
+        if _is_backend_failure(e):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        raise
+    except Exception:
+        # e.g. a ValueError from a malformed body - not a healthy response
+        breaker.record_failure()
+        raise
+    breaker.record_success()
+    return result
+
+
+def _schedule_refresh(request, executor=None):
+    """Revalidates a stale cache entry in the background, once per key at a time"""
+    with _refreshing_lock:
+        if request.cache_key in _refreshing:
+            return
+        _refreshing.add(request.cache_key)
+    (_executor if executor is None else executor).submit(_refresh, request)
+
+
+def _refresh(request):
+    """Background task for _schedule_refresh"""
+    try:
+        _inflight.do(request.cache_key, _fetch_and_cache, request)
+    except FETCH_ERRORS as e:
+        logger.warning(
+            f"Background refresh of {request.path} for team {request.team_id} failed: {e}"
+        )
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard(request.cache_key)
+
+
+def _fetch_and_cache(request):
+    """
+    Fetches lineup data from the backend and caches it (run once per in-flight key)
+
+    If a stale entry is cached, its ETag/Last-Modified are sent as a
+    conditional GET, and a 304 just marks the cached data fresh again.
+    """
+    # A previous flight may have refreshed the cache since our lookup (peeked,
+    # as the caller already counted that lookup)
+    entry = response_cache.peek(request.cache_key)
+    if entry is not None and entry[2]:
+        return entry[0], entry[1]
+
+    # Totals can be reduced from fresh full data without asking the backend
+    if request.mode == TOTALS:
+        full_entry = response_cache.peek(request.full().cache_key)
+        if full_entry is not None and full_entry[2]:
+            return _store_derived(request, full_entry[0].items())
+
+    if snapshot is not None:
+        return _store_derived(request, snapshot.load(request.full().cache_key).items())
+
+    return _call_backend(request.endpoint, _fetch_from_backend, request, entry)
+
+
+def _read_payload(request, week_items):
+    """Builds a request's payload from (week, week_data) pairs, reducing totals as they arrive"""
+    if request.mode == TOTALS:
+        return weekly_totals(week_items)
+    return dict(week_items)
+
+
+def _store_derived(request, week_items):
+    """Caches a payload built from already-fetched data, returning (data, meta)"""
+    data = _read_payload(request, week_items)
+    meta = {"version": payload_version(data)}
+    _store(request, data, meta)
+    return data, meta
+
+
+def _store(request, data, meta):
+    """Caches a request's payload in its league/season partition"""
+    # The latest week held, so refreshes can ask for later weeks only
+    if "high_water" not in meta:
+        meta["high_water"] = max((int(week) for week in data), default=None)
+    response_cache.set(
+        request.cache_key,
+        data,
+        ttl=cache_ttl_for(request.endpoint),
+        meta=meta,
+        partition=request.partition,
+    )
+
+
+def _fetch_from_backend(request, entry):
+    """Requests a payload (conditionally if entry is a stale cache entry) and caches it"""
+    if entry is not None and _can_fetch_incrementally(entry[1]):
+        return _fetch_new_weeks(request, entry)
+
+    headers = {}
+    if entry is not None:
+        meta = entry[1]
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    logger.info(f"Fetching data from {request.path} for team {request.team_id}")
+    url = f"{BASE_URL}/{request.path}"
+    fetched_at = time.time()
+    response = http_client.get(url, params=request.params, headers=headers, stream=True)
+
+    with response:
+        if response.status_code == 304 and entry is not None:
+            logger.info(
+                f"Data from {request.path} for team {request.team_id} not modified"
+            )
+            # Restarts the full-refresh interval along with the entry's TTL
+            meta = {**entry[1], "fetched_at": fetched_at}
+            _store(request, entry[0], meta)
+            return entry[0], meta
+
+        data = _read_payload(request, iter_response_weeks(response))
+
+    meta = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "version": payload_version(data),
+        "fetched_at": fetched_at,
+    }
+    _store(request, data, meta)
+    return data, meta
+
+
+def _can_fetch_incrementally(meta):
+    """Returns True if a stale entry can be refreshed by fetching its latest weeks only"""
+    return (
+        config.incremental_refresh
+        and bool(meta.get("version"))
+        and meta.get("high_water") is not None
+        and time.time() - meta.get("fetched_at", 0) < config.full_refresh_interval
+    )
+
+
+def _fetch_new_weeks(request, entry):
+    """
+    Refreshes a stale entry by fetching only its latest week and later ones
+
+    The latest cached week is fetched again, as it may have been cached
+    while its games were in progress. Weeks that changed or are new are
+    merged into the cached payload; earlier weeks are left to the periodic
+    full refresh (Config.full_refresh_interval). The new version is chained
+    from the old one, and meta records the parent version and the merged
+    weeks so decoded records and season models can be updated instead of
+    rebuilt.
+    """
+    data, meta, _ = entry
+    from_week = meta["high_water"]
+    logger.info(
+        f"Fetching weeks {from_week}+ from {request.path} for team {request.team_id}"
+    )
+    url = f"{BASE_URL}/{request.path}"
+    params = {**request.params, "fromWeek": from_week}
+    with http_client.get(url, params=params, stream=True) as response:
+        # Backends that ignore fromWeek send every week; keep only the latest
+        week_data = _read_payload(
+            request,
+            (
+                (week, week_data)
+                for week, week_data in iter_response_weeks(response)
+                if int(week) >= from_week
+            ),
+        )
+    changed = {
+        week: value for week, value in week_data.items() if data.get(week) != value
+    }
+
+    if not changed:
+        logger.info(f"No new weeks in {request.path} for team {request.team_id}")
+        response_cache.touch(request.cache_key, ttl=cache_ttl_for(request.endpoint))
+        return data, meta
+
+    encoded = json.dumps(changed, separators=(",", ":")).encode("utf-8")
+    new_meta = {
+        # Validators and the last full fetch still describe the base payload
+        "etag": meta.get("etag"),
+        "last_modified": meta.get("last_modified"),
+        "fetched_at": meta.get("fetched_at", 0),
+        "version": f"{zlib.crc32(encoded, int(meta['version'], 16)):08x}",
+        "parent": meta["version"],
+        "appended": list(changed),
+        "high_water": max(meta["high_water"], *(int(week) for week in changed)),
+    }
+    merged = {**data, **changed}
+    _store(request, merged, new_meta)
+    return merged, new_meta
+
+
+def iter_response_weeks(response):
+    """Yields (week, week_data) pairs from a streamed lineup response as they are decoded"""
+    return iter_object_items(ChunkReader(response.iter_content(CHUNK_SIZE)))
+
+
+def _collect_bundle(team_id, futures):
+    """Waits for a team's per-scenario futures and gathers them into a bundle"""
+    bundle = {"errors": {}, "versions": {}, "appends": {}}
+    for scenario, future in futures.items():
+        try:
+            data, meta = future.result()
+        except FETCH_ERRORS as e:
+            logger.error(f"Error fetching {scenario} lineups for team {team_id}: {e}")
+            bundle[scenario] = {}
+            bundle["versions"][scenario] = None
+            bundle["errors"][scenario] = str(e)
+            continue
+        bundle[scenario] = data
+        # Entries cached before versions were recorded get one computed here
+        bundle["versions"][scenario] = meta.get("version") or payload_version(data)
+        if meta.get("parent"):
+            bundle["appends"][scenario] = (meta["parent"], meta["appended"])
+    bundle["degraded"] = bool(bundle["errors"])
+    return bundle
+
+
+def bundle_is_complete(bundle):
+    """Returns True if every scenario in a bundle was fetched and has weeks of data"""
+    return not bundle["degraded"] and all(
+        bundle[scenario] for scenario in LINEUP_ENDPOINTS
+    )
+
+
+def _submit_team(league_id, season, team_id, mode=FULL, executor=None):
+    """Submits a team's per-scenario fetches to a pool (the fetch pool by default)"""
+    executor = _executor if executor is None else executor
+    return {
+        scenario: executor.submit(
+            _load_lineup_entry,
+            LineupRequest(league_id, season, endpoint, team_id, mode),
+            executor,
+        )
+        for scenario, endpoint in LINEUP_ENDPOINTS.items()
+    }
+
+
+def fetch_team_lineups(team_id, league_id=None, season=None, mode=FULL):
+    """
+    Fetches every lineup scenario for a team concurrently
+
+    Args:
+        team_id: The team ID to fetch data for
+        league_id: League to fetch from (defaults to Config.default_league_id)
+        season: Season to fetch (defaults to Config.default_season)
+        mode: FULL for every player, or TOTALS for weekly point totals only
+
+    Returns:
+        A bundle dict with one entry per LINEUP_ENDPOINTS scenario ("draft",
+        "actual_best", "actual_lineup") holding its data ({} on failure), plus
+        "errors" mapping each failed scenario to its error message,
+        "versions" mapping each scenario to its payload version (None on
+        failure), "appends" mapping scenarios refreshed incrementally to
+        their (parent version, appended week keys), and "degraded", True if
+        any scenario failed
+    """
+    futures = _submit_team(*resolve_league(league_id, season), team_id, mode)
+    return _collect_bundle(team_id, futures)
+
+
+def fetch_league_lineups(
+    team_ids=None, league_id=None, season=None, mode=FULL, executor=None
+):
+    """
+    Fetches every lineup scenario for every team in the league in one burst
+
+    All team × scenario requests are submitted to the fetch pool at once, and
+    each response lands in the per-team cache entries, so later per-team
+    calls (e.g. the tab 1 callbacks) are cache hits.
+
+    Args:
+        team_ids: Team IDs to fetch (defaults to Config.league_team_ids)
+        league_id: League to fetch from (defaults to Config.default_league_id)
+        season: Season to fetch (defaults to Config.default_season)
+        mode: FULL for every player, or TOTALS for weekly point totals only
+        executor: Pool to run the requests on (defaults to the fetch pool)
+
+    Returns:
+        A dict mapping each team ID to its fetch_team_lineups()-style bundle
+    """
+    team_ids = config.league_team_ids if team_ids is None else team_ids
+    league_id, season = resolve_league(league_id, season)
+    futures = {
+        team_id: _submit_team(league_id, season, team_id, mode, executor)
+        for team_id in team_ids
+    }
+    return {
+        team_id: _collect_bundle(team_id, team_futures)
+        for team_id, team_futures in futures.items()
+    }
+
+
+def _decode_cached(cache_key, version, data, decoder, append=None):
+    """
+    Decodes a payload with decoder, reusing the last decode of the same version
+
+    If weeks were merged into the payload (append is its (parent version,
+    merged week keys)) and the parent's decode is cached, only those weeks
+    are decoded.
+    """
+    with _decoded_lock:
+        cached = _decoded.get(cache_key)
+        if cached is not None and cached[0] == version:
+            _decoded.move_to_end(cache_key)
+            return cached[1]
+
+    if append is not None and cached is not None and cached[0] == append[0]:
+        # Merged weeks replace their old records (if any) and go last
+        merged = {int(week) for week in append[1]}
+        weeks = tuple(week for week in cached[1] if week.week not in merged)
+        weeks += tuple(decoder({week: data[week] for week in append[1]}))
+    else:
+        weeks = decoder(data)
+    with _decoded_lock:
+        _decoded[cache_key] = (version, weeks)
+        _decoded.move_to_end(cache_key)
+        while len(_decoded) > config.cache_max_entries:
+            _decoded.popitem(last=False)
+    return weeks
+
+
+def fetch_team_weeks(team_id, league_id=None, season=None):
+    """
+    Fetches every lineup scenario for a team as validated Week records
+
+    Payloads are decoded once per version and the decoded records are shared
+    by later calls, so components never walk the raw nested dicts.
+
+    Args:
+        team_id: The team ID to fetch data for
+        league_id: League to fetch from (defaults to Config.default_league_id)
+        season: Season to fetch (defaults to Config.default_season)
+
+    Returns:
+        A fetch_team_lineups()-style bundle whose scenarios hold tuples of
+        Week records (empty on fetch or validation failure)
+    """
+    return _fetch_decoded(team_id, league_id, season, FULL, decode_lineups)
+
+
+def fetch_team_totals(team_id, league_id=None, season=None):
+    """
+    Fetches every lineup scenario for a team as weekly point totals
+
+    Only the starters' total per week is fetched (or reduced on arrival) and
+    cached, which is all the season charts and summary cards need. Player
+    detail is left to fetch_team_weeks, for views that show it.
+
+    Args:
+        team_id: The team ID to fetch data for
+        league_id: League to fetch from (defaults to Config.default_league_id)
+        season: Season to fetch (defaults to Config.default_season)
+
+    Returns:
+        A fetch_team_lineups()-style bundle whose scenarios hold tuples of
+        WeekTotal records (empty on fetch or validation failure)
+    """
+    return _fetch_decoded(team_id, league_id, season, TOTALS, decode_totals)
+
+
+def fetch_league_totals(team_ids=None, league_id=None, season=None):
+    """
+    Fetches weekly point totals for every team in the league in one burst
+
+    Args:
+        team_ids: Team IDs to fetch (defaults to Config.league_team_ids)
+        league_id: League to fetch from (defaults to Config.default_league_id)
+        season: Season to fetch (defaults to Config.default_season)
+
+    Returns:
+        A dict mapping each team ID to its fetch_team_totals()-style bundle
+    """
+    league_id, season = resolve_league(league_id, season)
+    bundles = fetch_league_lineups(team_ids, league_id, season, TOTALS)
+    return {
+        team_id: _decode_bundle(
+            bundle, team_id, league_id, season, TOTALS, decode_totals
+        )
+        for team_id, bundle in bundles.items()
+    }
+
+
+def _fetch_decoded(team_id, league_id, season, mode, decoder):
+    """Fetches a team's bundle in the given mode and decodes each scenario with decoder"""
+    league_id, season = resolve_league(league_id, season)
+    bundle = fetch_team_lineups(team_id, league_id, season, mode)
+    return _decode_bundle(bundle, team_id, league_id, season, mode, decoder)
+
+
+def _decode_bundle(bundle, team_id, league_id, season, mode, decoder):
+    """Decodes each scenario of a fetched bundle in place with decoder"""
+    for scenario, endpoint in LINEUP_ENDPOINTS.items():
+        if scenario in bundle["errors"]:
+            bundle[scenario] = ()
+            continue
+        request = LineupRequest(league_id, season, endpoint, team_id, mode)
+        try:
+            bundle[scenario] = _decode_cached(
+                request.cache_key,
+                bundle["versions"][scenario],
+                bundle[scenario],
+                decoder,
+                bundle["appends"].get(scenario),
+            )
+        except ValueError as e:
+            logger.error(f"Invalid {scenario} lineups for team {team_id}: {e}")
+            bundle[scenario] = ()
+            bundle["errors"][scenario] = str(e)
+            bundle["degraded"] = True
+    return bundle
+
+
+def fetch_stats():
+    """Returns cache counters, coalesced backend calls and circuit breaker states"""
+    with _breakers_lock:
+        breakers = {name: breaker.state for name, breaker in _breakers.items()}
+    return {
+        "cache": response_cache.stats(),
+        "requests": _inflight.stats(),
+        "breakers": breakers,
+    }
@@ -1,34 +1,22 @@
-def process_weekly_data(api_data):
-    """Processes API data into points per week & formatted hover text"""
-    api_data = {int(k): v for k, v in api_data.items()}
-    weeks = sorted(api_data.keys())
-    points_per_week = []
-    hover_data = []
+def week_total(week_data):
+    """Returns the total points scored by a week's starters"""
+    return sum(
+        player["points"]
+        for position in week_data.get("starters", {}).values()
+        for player in position
+    )
 
-    for week in weeks:
-        week_data = api_data[week]
-        best_lineup = week_data.get("starters", {})
-        # bench = week_data.get("bench", {})
 
-        # Calculate total points
-        total_points = sum(
-            player["points"] for position in best_lineup.values() for player in position
-        )
-        points_per_week.append(total_points)
-
-        # # Create formatted hover tooltip
-        # hover_text = "<b>Starters</b><br>"
-        # hover_text += "<br>".join(
-        #     f"{position}: {player['name']} ({player['points']} pts)"
-        #     for position, players in best_lineup.items()
-        #     for player in players
-        # )
-        # hover_text += "<br><b>Bench</b><br>"
-        # hover_text += "<br>".join(
-        #     f"{position}: {player['name']} ({player['points']} pts)"
-        #     for position, players in bench.items()
-        #     for player in players
-        # )
-        # hover_data.append(hover_text)
+def weekly_totals(week_items):
+    """
+    Reduces (week, week_data) pairs to a {week: total points} payload as they arrive
 
-    return weeks, points_per_week, hover_data
+    Each week's player detail is dropped as soon as it is totalled. Values
+    that are already totals (a backend projection) are kept as they are.
+    """
+    return {
+        week: (
+            week_data if isinstance(week_data, (int, float)) else week_total(week_data)
+        )
+        for week, week_data in week_items
+    }
@@ -0,0 +1,135 @@
+import json
+from functools import lru_cache
+
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.utils import PlotlyJSONEncoder
+
+from app.config import config
+
+try:
+    import orjson
+except ImportError:  # Optional faster encoder
+    orjson = None
+
+
+class FigureBuilder:
+    """
+    Collects traces and layout as plain dicts, in plotly's figure schema
+
+    Property names are written out nested (marker=dict(color=...)), not with
+    go's magic underscores (marker_color=...), since nothing here validates
+    or expands them.
+    """
+
+    __slots__ = ("data", "layout")
+
+    def __init__(self):
+        self.data = []
+        self.layout = {}
+
+    def add_trace(self, trace):
+        """Appends a trace dict (see scatter() and bar())"""
+        self.data.append(trace)
+
+    def add_shape(self, **shape):
+        """Appends a layout shape"""
+        self.layout.setdefault("shapes", []).append(shape)
+
+    def update_layout(self, **layout):
+        """Sets top-level layout properties"""
+        self.layout.update(layout)
+
+    def build(self):
+        """
+        Returns the finished figure
+
+        Returns:
+            A plain figure dict with its template inlined, or a validated
+            go.Figure of the same content if Config.fast_figures is off
+        """
+        if not config.fast_figures:
+            return go.Figure(data=self.data, layout=self.layout)
+
+        layout = dict(self.layout)
+        template = layout.get("template", pio.templates.default)
+        if isinstance(template, str):
+            layout["template"] = _template_json(template)
+        return {"data": self.data, "layout": layout}
+
+
+def scatter(**props):
+    """Returns a scatter trace dict"""
+    return dict(type="scatter", **props)
+
+
+def bar(**props):
+    """Returns a bar trace dict"""
+    return dict(type="bar", **props)
+
+
+def split_figure(figure, trace_keys, layout_keys):
+    """
+    Splits a figure dict into its static frame and the series that vary with data
+
+    The browser rebuilds the figure by merging each series trace into the
+    frame's trace at the same index, and the series layout into the frame
+    layout (one level deep), so only the series need resending on a change.
+
+    Args:
+        figure: Plain figure dict (e.g. from FigureBuilder.build)
+        trace_keys: Trace properties that vary with data (e.g. "x", "y")
+        layout_keys: Layout properties that vary with data, either top-level
+            ("annotations") or one level down ("xaxis.range")
+
+    Returns:
+        (frame, series) figure dicts
+    """
+    frame_data, series_data = [], []
+    for trace in figure["data"]:
+        frame_data.append({k: v for k, v in trace.items() if k not in trace_keys})
+        series_data.append({k: trace[k] for k in trace_keys if k in trace})
+
+    frame_layout, series_layout = dict(figure["layout"]), {}
+    for path in layout_keys:
+        key, _, child = path.partition(".")
+        if key not in frame_layout:
+            continue
+        if not child:
+            series_layout[key] = frame_layout.pop(key)
+        elif child in frame_layout[key]:
+            frame_layout[key] = dict(frame_layout[key])
+            series_layout.setdefault(key, {})[child] = frame_layout[key].pop(child)
+
+    return (
+        {"data": frame_data, "layout": frame_layout},
+        {"data": series_data, "layout": series_layout},
+    )
+
+
+@lru_cache(maxsize=None)
+def _template_json(name):
+    """Returns a named template as the dict go.Figure would inline (shared; not to be mutated)"""
+    return json.loads(pio.json.to_json_plotly(pio.templates[name]))
+
+
+def _to_plotly_json(value):
+    """Encodes values orjson doesn't know (figures, Dash components)"""
+    if hasattr(value, "to_plotly_json"):
+        return value.to_plotly_json()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def to_json(value):
+    """
+    Serializes a figure dict, go.Figure or Dash component tree to JSON
+
+    Uses orjson when installed, otherwise plotly's JSON encoder.
+    """
+    if orjson is None:
+        return json.dumps(value, cls=PlotlyJSONEncoder, separators=(",", ":"))
+    return orjson.dumps(
+        value,
+        default=_to_plotly_json,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    ).decode("utf-8")
@@ -0,0 +1,59 @@
+import json
+import logging
+
+from app.config import config
+from app.utils.cache import ResponseCache
+from app.utils.figure_builder import to_json
+
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+# Rendered figures and component trees, as the JSON Dash sends to the browser
+_rendered = ResponseCache(
+    max_entries=config.figure_cache_max_entries,
+    max_bytes=config.figure_cache_max_bytes,
+    default_ttl=config.figure_cache_ttl,
+)
+
+
+def render_key(kind, *inputs):
+    """Returns a cache key for a rendered output from its kind and inputs"""
+    return ":".join([kind, *(str(value) for value in inputs)])
+
+
+def render_cached(key, version, build):
+    """
+    Returns a rendered output as plain JSON, building it only on a cache miss
+
+    Args:
+        key: Identifies the output and its inputs (see render_key)
+        version: Version of the data it is built from; None skips the cache
+            (e.g. for placeholders shown while data is unavailable)
+        build: Callable returning the plotly figure or Dash component
+
+    Returns:
+        The output serialized to JSON-compatible dicts and lists, which Dash
+        sends as is
+    """
+    if version is None:
+        return build()
+
+    versioned_key = f"{key}@{version}"
+    rendered = _rendered.get(versioned_key)
+    if rendered is not None:
+        return rendered
+
+    rendered = json.loads(to_json(build()))
+    _rendered.set(versioned_key, rendered)
+    return rendered
+
+
+def stats():
+    """Returns rendered-output cache counters"""
+    return _rendered.stats()
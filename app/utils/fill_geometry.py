@@ -0,0 +1,71 @@
+import numpy as np
+
+
+def fill_polygons(x, upper, lower):
+    """
+    Splits the area between two lines into fill polygons by which line is on top
+
+    Segments where the lines cross are split at the intersection. Segments
+    where the lines are equal or only touch count as positive.
+
+    Args:
+        x: Shared x values of both lines (increasing)
+        upper: y values of the line that is "positive" when on top
+        lower: y values of the other line
+
+    Returns:
+        ((positive_x, positive_y), (negative_x, negative_y)): closed paths
+        (forward along the top line, back along the bottom one) for
+        fill="toself" traces, as NumPy arrays (empty if there is no such area)
+    """
+    x = np.asarray(x, dtype=float)
+    a = np.asarray(upper, dtype=float)
+    b = np.asarray(lower, dtype=float)
+
+    x1, x2 = x[:-1], x[1:]
+    a1, a2 = a[:-1], a[1:]
+    b1, b2 = b[:-1], b[1:]
+
+    # Strict sign changes of a - b; equal or touching points don't cross
+    a_first = (a1 > b1) & (a2 < b2)
+    b_first = (a1 < b1) & (a2 > b2)
+
+    # Intersections of the two segments (y = m*x + c), where they cross
+    with np.errstate(divide="ignore", invalid="ignore"):
+        m_b = (b2 - b1) / (x2 - x1)
+        c_b = b1 - m_b * x1
+        m_a = (a2 - a1) / (x2 - x1)
+        c_a = a1 - m_a * x1
+        x_cross = (c_a - c_b) / (m_b - m_a)
+        y_cross = m_b * x_cross + c_b
+    crosses = (a_first | b_first) & (m_b != m_a)
+
+    a_above = ~(a_first | b_first) & (a1 >= b1) & (a2 >= b2)
+    b_above = ~(a_first | b_first) & ~a_above & (b1 >= a1) & (b2 >= a2)
+
+    positive = _segment_path(
+        crosses | a_above,
+        np.where(b_first, x_cross, x1),
+        np.where(a_first, x_cross, x2),
+        (np.where(b_first, y_cross, a1), np.where(a_first, y_cross, a2)),
+        (np.where(b_first, y_cross, b1), np.where(a_first, y_cross, b2)),
+    )
+    negative = _segment_path(
+        crosses | b_above,
+        np.where(a_first, x_cross, x1),
+        np.where(b_first, x_cross, x2),
+        (np.where(a_first, y_cross, b1), np.where(b_first, y_cross, b2)),
+        (np.where(a_first, y_cross, a1), np.where(b_first, y_cross, a2)),
+    )
+    return positive, negative
+
+
+def _segment_path(mask, start_x, end_x, top, bottom):
+    """Joins the masked segments into one closed (x, y) path"""
+    xs = np.column_stack((start_x, end_x))[mask].ravel()
+    top_ys = np.column_stack(top)[mask].ravel()
+    bottom_ys = np.column_stack(bottom)[mask].ravel()
+    return (
+        np.concatenate((xs, xs[::-1])),
+        np.concatenate((top_ys, bottom_ys[::-1])),
+    )
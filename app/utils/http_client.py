@@ -0,0 +1,101 @@
+import logging
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.config import config
+
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying - everything else is returned or raised as is
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Shared keep-alive session, created lazily on first request
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Returns the module-level pooled session, creating it on first use"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=config.http_pool_size,
+                    pool_maxsize=config.http_pool_size,
+                    max_retries=0,  # Retries are handled by get() below
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def backoff_delay(attempt):
+    """Full-jitter exponential backoff delay (in seconds) for a retry attempt"""
+    return random.uniform(0, config.http_backoff_base * (2**attempt))
+
+
+def get(url, params=None, headers=None, stream=False):
+    """
+    Sends a GET request on the pooled session with timeouts and bounded retries
+
+    Connection errors, timeouts and retryable status codes are retried with
+    jittered backoff until either the retry count or the retry budget (total
+    seconds spent) runs out, at which point the last error is raised.
+
+    Args:
+        url: Full URL to request
+        params: Optional query parameters
+        headers: Optional request headers
+        stream: Whether to defer downloading the response body
+
+    Returns:
+        A requests.Response with a non-error status code
+    """
+    deadline = time.monotonic() + config.http_retry_budget
+    timeout = (config.http_connect_timeout, config.http_read_timeout)
+    attempt = 0
+
+    while True:
+        try:
+            response = get_session().get(
+                url, params=params, headers=headers, timeout=timeout, stream=stream
+            )
+            if response.status_code not in RETRY_STATUS_CODES:
+                try:
+                    response.raise_for_status()
+                except requests.exceptions.HTTPError:
+                    # Release the connection of a streamed response
+                    response.close()
+                    raise
+                return response
+            error = requests.exceptions.HTTPError(
+                f"{response.status_code} Server Error for url: {response.url}",
+                response=response,
+            )
+            response.close()
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            error = e
+
+        delay = backoff_delay(attempt)
+        if attempt >= config.http_max_retries or time.monotonic() + delay > deadline:
+            raise error
+
+        attempt += 1
+        logger.warning(
+            f"Retrying {url} in {delay:.2f}s (attempt {attempt}/{config.http_max_retries}): {error}"
+        )
+        time.sleep(delay)
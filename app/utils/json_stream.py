@@ -0,0 +1,142 @@
+import codecs
+import json
+
+try:
+    # Optional faster parser; only its C backend beats the fallback below
+    import ijson.backends.yajl2_c as ijson
+    from ijson.common import JSONError
+except ImportError:
+    ijson = None
+
+# Bytes read from the source per step
+CHUNK_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+# Characters a JSON number can continue with
+_NUMBER_CHARS = "0123456789+-.eE"
+
+
+def iter_object_items(fileobj, chunk_size=CHUNK_SIZE):
+    """
+    Yields the (key, value) pairs of a top-level JSON object as it is read
+
+    Each value is decoded as soon as its bytes have arrived, so the whole
+    document (or its raw text) is never held in memory at once. Uses ijson's
+    C backend when it is installed, and a pure-Python incremental decoder
+    otherwise.
+
+    Args:
+        fileobj: Binary file-like object with a read(size) method
+        chunk_size: Bytes to read per step
+    """
+    if ijson is not None:
+        try:
+            yield from ijson.kvitems(fileobj, "", use_float=True, buf_size=chunk_size)
+        except JSONError as e:
+            # Raised as ValueError, like the fallback, for callers' error handling
+            raise ValueError(f"Malformed JSON: {e}") from e
+        return
+    yield from _iter_object_items(fileobj, chunk_size)
+
+
+def _iter_object_items(fileobj, chunk_size):
+    """Pure-Python fallback for iter_object_items built on JSONDecoder.raw_decode"""
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    pos = 0
+    eof = False
+    # What is expected next: "open", "first" (a key or "}"), "key", "colon",
+    # "value", "separator" or "end" (nothing but whitespace)
+    state = "open"
+
+    while True:
+        # Skip whitespace, reading more input whenever the buffer runs dry
+        while pos < len(buf) and buf[pos] in _WHITESPACE:
+            pos += 1
+        if pos == len(buf):
+            if eof:
+                if state == "end":
+                    return
+                raise ValueError("Unexpected end of JSON object")
+            chunk = fileobj.read(chunk_size)
+            eof = not chunk
+            buf = buf[pos:] + text_decoder.decode(chunk, final=eof)
+            pos = 0
+            continue
+
+        char = buf[pos]
+        if state == "end":
+            raise ValueError(f"Extra data after JSON object at {char!r}")
+        if state == "open":
+            if char != "{":
+                raise ValueError("Expected a JSON object")
+            pos += 1
+            state = "first"
+        elif state in ("first", "separator") and char == "}":
+            pos += 1
+            state = "end"
+        elif state == "separator":
+            if char != ",":
+                raise ValueError(f"Expected ',' or '}}' at {char!r}")
+            pos += 1
+            state = "key"
+        elif state == "colon":
+            if char != ":":
+                raise ValueError(f"Expected ':' at {char!r}")
+            pos += 1
+            state = "value"
+        elif state != "value" and char != '"':
+            raise ValueError(f"Expected a string key at {char!r}")
+        else:
+            try:
+                parsed, end = _decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                parsed, end = None, None
+            # A value running to the end of the buffer may still be incomplete,
+            # as may a number whose next characters haven't arrived ("12." | "75")
+            if end is None or (
+                not eof and (end == len(buf) or _may_continue(parsed, buf, end))
+            ):
+                if eof:
+                    raise ValueError("Truncated JSON value")
+                chunk = fileobj.read(chunk_size)
+                eof = not chunk
+                buf = buf[pos:] + text_decoder.decode(chunk, final=eof)
+                pos = 0
+                continue
+            pos = end
+            if state != "value":
+                key = parsed
+                state = "colon"
+            else:
+                yield key, parsed
+                state = "separator"
+
+
+def _may_continue(parsed, buf, end):
+    """Returns True if a number decoded up to end could be longer given more input"""
+    if isinstance(parsed, bool) or not isinstance(parsed, (int, float)):
+        return False
+    return all(char in _NUMBER_CHARS for char in buf[end:])
+
+
+class ChunkReader:
+    """Minimal binary file-like wrapper around an iterator of byte chunks"""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._pending = b""
+
+    def read(self, size=-1):
+        """Returns up to size bytes (everything left if size < 0), b"" at the end"""
+        while size < 0 or len(self._pending) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._pending += chunk
+        if size < 0:
+            data, self._pending = self._pending, b""
+        else:
+            data, self._pending = self._pending[:size], self._pending[size:]
+        return data
@@ -0,0 +1,168 @@
+import logging
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from app.config import config
+from app.utils.data_fetcher import fetch_league_totals, resolve_league
+from app.utils.season_model import SCENARIOS
+
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+# Built models per (league, season, teams), reused while the payload versions hold
+_models = OrderedDict()
+_models_lock = threading.Lock()
+
+
+class LeagueModel:
+    """
+    Dense league-wide starter points per (scenario × team × week)
+
+    Teams whose data is unavailable are left out (see missing_teams); a team
+    missing a week holds NaN there.
+    """
+
+    __slots__ = ("team_ids", "missing_teams", "versions", "weeks", "points")
+
+    def __init__(self, team_ids, missing_teams, versions, weeks, points):
+        self.team_ids = team_ids
+        self.missing_teams = missing_teams
+        self.versions = versions
+        self.weeks = weeks
+        self.points = points
+
+    def row(self, scenario):
+        """Returns a scenario's index on the first axis"""
+        return SCENARIOS.index(scenario)
+
+    def weekly_averages(self):
+        """Returns the league average per (scenario × week)"""
+        return np.nanmean(self.points, axis=1)
+
+    def season_averages(self):
+        """Returns each team's average weekly points per (scenario × team)"""
+        return np.nanmean(self.points, axis=2)
+
+    def weekly_ranks(self):
+        """Returns each team's rank (1 = most points) per (scenario × team × week)"""
+        # NaN sorts last, so a missing week ranks below every scored one
+        order = np.argsort(-self.points, axis=1, kind="stable")
+        ranks = np.empty_like(order)
+        np.put_along_axis(
+            ranks, order, np.arange(1, len(self.team_ids) + 1)[None, :, None], axis=1
+        )
+        return ranks
+
+    def season_ranks(self):
+        """Returns each team's rank by season average per (scenario × team)"""
+        order = np.argsort(-self.season_averages(), axis=1, kind="stable")
+        ranks = np.empty_like(order)
+        np.put_along_axis(
+            ranks, order, np.arange(1, len(self.team_ids) + 1)[None, :], axis=1
+        )
+        return ranks
+
+    def deltas(self):
+        """Returns each team's points above the league average per (scenario × team × week)"""
+        return self.points - self.weekly_averages()[:, None, :]
+
+    def impacts(self):
+        """
+        Returns per-team average weekly impacts
+
+        Returns:
+            (transaction_impact, lineup_impact, lineup_efficiency) arrays
+            indexed by team
+        """
+        draft, actual_best, actual_lineup = self.season_averages()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            efficiency = np.where(
+                actual_best > 0, actual_lineup / actual_best * 100, 0.0
+            )
+        return actual_best - draft, actual_lineup - actual_best, efficiency
+
+
+def _build_model(bundles, versions):
+    """Builds a LeagueModel from fetch_league_totals() bundles"""
+    team_ids = [
+        team_id
+        for team_id, bundle in bundles.items()
+        if not bundle["degraded"] and all(bundle[s] for s in SCENARIOS)
+    ]
+    missing_teams = [team_id for team_id in bundles if team_id not in team_ids]
+
+    weeks = np.array(
+        sorted(
+            {
+                week.week
+                for team_id in team_ids
+                for s in SCENARIOS
+                for week in bundles[team_id][s]
+            }
+        ),
+        dtype=int,
+    )
+    week_index = {int(week): j for j, week in enumerate(weeks)}
+
+    # One pass over every team's totals fills the whole matrix
+    points = np.full((len(SCENARIOS), len(team_ids), len(weeks)), np.nan)
+    for t, team_id in enumerate(team_ids):
+        for s, scenario in enumerate(SCENARIOS):
+            records = bundles[team_id][scenario]
+            columns = [week_index[week.week] for week in records]
+            points[s, t, columns] = [week.total for week in records]
+
+    return LeagueModel(team_ids, missing_teams, versions, weeks, points)
+
+
+def load_league_model(team_ids=None, league_id=None, season=None):
+    """
+    Returns the LeagueModel for a league season, built once per payload version
+
+    Every team's weekly totals are fetched in one burst, so this costs about
+    as much as loading a single team.
+
+    Args:
+        team_ids: Team IDs to include (defaults to Config.league_team_ids)
+        league_id: League to load (defaults to Config.default_league_id)
+        season: Season to load (defaults to Config.default_season)
+
+    Returns:
+        A LeagueModel, or None if no team's data is available
+    """
+    team_ids = config.league_team_ids if team_ids is None else team_ids
+    league_id, season = resolve_league(league_id, season)
+    bundles = fetch_league_totals(team_ids, league_id, season)
+
+    key = (league_id, season, tuple(team_ids))
+    versions = tuple(
+        bundles[team_id]["versions"][s] for team_id in team_ids for s in SCENARIOS
+    )
+    with _models_lock:
+        model = _models.get(key)
+        if model is not None and model.versions == versions:
+            _models.move_to_end(key)
+            return model
+
+    model = _build_model(bundles, versions)
+    if model.missing_teams:
+        logger.warning(
+            f"League {league_id} ({season}) is missing teams {model.missing_teams}"
+        )
+    if not model.team_ids:
+        return None
+
+    with _models_lock:
+        _models[key] = model
+        _models.move_to_end(key)
+        while len(_models) > config.cache_max_entries:
+            _models.popitem(last=False)
+    return model
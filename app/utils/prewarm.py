@@ -0,0 +1,97 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.config import config
+from app.utils.data_fetcher import TOTALS, fetch_league_lineups
+from app.utils.league_model import load_league_model
+from app.utils.season_model import load_season_summary
+
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+# Prewarm's own small pool, so warming never queues page loads' fetches
+_executor = ThreadPoolExecutor(
+    max_workers=max(1, config.prewarm_concurrency), thread_name_prefix="prewarm"
+)
+
+# Set once the first prewarm pass has finished
+_ready = threading.Event()
+_thread = None
+_thread_lock = threading.Lock()
+
+
+def is_ready():
+    """Returns True once the first prewarm pass has finished"""
+    return _ready.is_set()
+
+
+def prewarm_once(team_ids=None):
+    """
+    Fetches every team's weekly totals into the cache, a few requests at a time
+
+    Totals are what the season overview needs on first load; player detail
+    is fetched when a team's weekly analysis is opened. Requests run on
+    prewarm's own pool of Config.prewarm_concurrency workers.
+
+    Args:
+        team_ids: Team IDs to warm (defaults to Config.league_team_ids)
+
+    Returns:
+        Number of teams that had at least one failed scenario
+    """
+    team_ids = config.league_team_ids if team_ids is None else team_ids
+    started = time.monotonic()
+    failed = 0
+
+    bundles = fetch_league_lineups(team_ids, mode=TOTALS, executor=_executor)
+    for team_id, bundle in bundles.items():
+        if bundle["errors"]:
+            failed += 1
+        else:
+            # Build the season summary too, so the first page load is a lookup
+            load_season_summary(team_id)
+
+    # League-wide matrices for the League Breakdown tab (all cache hits by now)
+    load_league_model(team_ids)
+
+    logger.info(
+        f"Prewarmed {len(team_ids)} teams in {time.monotonic() - started:.1f}s "
+        f"({failed} with errors)"
+    )
+    return failed
+
+
+def _run():
+    """Prewarm loop: one pass at startup, then one every Config.prewarm_interval seconds"""
+    while True:
+        try:
+            prewarm_once()
+        except Exception:
+            logger.exception("Cache prewarm failed")
+        # Failed teams are served (and retried) on demand, so don't hold back traffic
+        _ready.set()
+
+        if config.prewarm_interval <= 0:
+            return
+        time.sleep(config.prewarm_interval)
+
+
+def start():
+    """Starts the background prewarm thread, or marks the app ready if prewarm is disabled"""
+    global _thread
+    if not config.prewarm_enabled:
+        _ready.set()
+        return
+
+    with _thread_lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_run, name="cache-prewarm", daemon=True)
+            _thread.start()
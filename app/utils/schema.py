@@ -0,0 +1,153 @@
+import sys
+
+
+class PayloadError(ValueError):
+    """Raised when a lineup payload does not match the expected schema"""
+
+
+class Player:
+    """A player's points in one lineup slot"""
+
+    __slots__ = ("name", "position", "points")
+
+    def __init__(self, name, position, points):
+        self.name = name
+        self.position = position
+        self.points = points
+
+    def __repr__(self):
+        return f"Player({self.name!r}, {self.position!r}, {self.points})"
+
+
+class Lineup:
+    """An ordered group of players (starters or bench) with their point total"""
+
+    __slots__ = ("players", "total")
+
+    def __init__(self, players):
+        self.players = players
+        self.total = sum(player.points for player in players)
+
+    def by_position(self):
+        """Returns a dict of position -> players, in payload order"""
+        positions = {}
+        for player in self.players:
+            positions.setdefault(player.position, []).append(player)
+        return positions
+
+
+class Week:
+    """One week of a lineup scenario"""
+
+    __slots__ = ("week", "starters", "bench")
+
+    def __init__(self, week, starters, bench):
+        self.week = week
+        self.starters = starters
+        self.bench = bench
+
+
+class WeekTotal:
+    """One week of a lineup scenario reduced to the starters' point total"""
+
+    __slots__ = ("week", "total")
+
+    def __init__(self, week, total):
+        self.week = week
+        self.total = total
+
+
+def _decode_week_key(key):
+    """Returns a payload's week key as an int, raising PayloadError if invalid"""
+    try:
+        return int(key)
+    except (TypeError, ValueError):
+        raise PayloadError(f"Invalid week key: {key!r}") from None
+
+
+def _decode_lineup(positions, week, field):
+    """Decodes a {position: [{"name", "points"}, ...]} mapping into a Lineup"""
+    if not isinstance(positions, dict):
+        raise PayloadError(f"Week {week} {field} must be an object")
+
+    players = []
+    for position, position_players in positions.items():
+        if not isinstance(position_players, list):
+            raise PayloadError(f"Week {week} {field} {position} must be a list")
+        position = sys.intern(position)
+        for player in position_players:
+            try:
+                name = player["name"]
+                points = player["points"]
+            except (KeyError, TypeError):
+                raise PayloadError(
+                    f"Week {week} {field} {position} player needs a name and points"
+                ) from None
+            if not isinstance(name, str):
+                raise PayloadError(f"Week {week} {field} player name must be a string")
+            if isinstance(points, bool) or not isinstance(points, (int, float)):
+                raise PayloadError(
+                    f"Week {week} {field} {name} points must be a number"
+                )
+            players.append(Player(sys.intern(name), position, float(points)))
+    return Lineup(tuple(players))
+
+
+def decode_lineups(payload):
+    """
+    Decodes and validates a lineup endpoint payload into Week records
+
+    Args:
+        payload: Backend response mapping week number (as a string) to
+            {"starters": {...}, "bench": {...}}
+
+    Returns:
+        A tuple of Week records sorted by week
+
+    Raises:
+        PayloadError: If the payload does not match the schema
+    """
+    if not isinstance(payload, dict):
+        raise PayloadError("Lineup payload must be an object")
+
+    weeks = []
+    for key, week_data in payload.items():
+        week = _decode_week_key(key)
+        if not isinstance(week_data, dict):
+            raise PayloadError(f"Week {week} must be an object")
+        weeks.append(
+            Week(
+                week,
+                _decode_lineup(week_data.get("starters", {}), week, "starters"),
+                _decode_lineup(week_data.get("bench", {}), week, "bench"),
+            )
+        )
+    weeks.sort(key=lambda week: week.week)
+    return tuple(weeks)
+
+
+def decode_totals(payload):
+    """
+    Decodes and validates a weekly totals payload into WeekTotal records
+
+    Args:
+        payload: Mapping of week number (as a string) to the starters' total
+            points, as cached by the totals fetch mode
+
+    Returns:
+        A tuple of WeekTotal records sorted by week
+
+    Raises:
+        PayloadError: If the payload does not match the schema
+    """
+    if not isinstance(payload, dict):
+        raise PayloadError("Totals payload must be an object")
+
+    weeks = []
+    for key, total in payload.items():
+        week = _decode_week_key(key)
+        if isinstance(total, bool) or not isinstance(total, (int, float)):
+            raise PayloadError(f"Week {week} total must be a number")
+        weeks.append(WeekTotal(week, float(total)))
+    weeks.sort(key=lambda week: week.week)
+    return tuple(weeks)
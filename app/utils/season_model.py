@@ -0,0 +1,632 @@
+import copy
+import logging
+import threading
+from collections import Counter, OrderedDict
+
+import numpy as np
+
+from app.config import config
+from app.utils.data_fetcher import (
+    LINEUP_ENDPOINTS,
+    bundle_is_complete,
+    fetch_team_totals,
+    fetch_team_weeks,
+    resolve_league,
+)
+
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+# Scenario order of the model's first axis
+SCENARIOS = tuple(LINEUP_ENDPOINTS)
+_DRAFT = SCENARIOS.index("draft")
+_ACTUAL_BEST = SCENARIOS.index("actual_best")
+_ACTUAL_LINEUP = SCENARIOS.index("actual_lineup")
+
+# Built models per (league, season, team), reused while the payload versions hold
+_models = OrderedDict()
+_models_lock = threading.Lock()
+
+
+class SlotTensor:
+    """
+    Starter points per (scenario × week × slot) for one team
+
+    slots holds each slot's position, grouped by position ("QB", "RB", "RB",
+    ...) with room for the most starters any week has at it. Empty slots
+    hold 0 points and an empty name. present marks the
+    (scenario × week) pairs the payloads have, and benches holds each
+    scenario's {week: bench Players}.
+    """
+
+    __slots__ = (
+        "versions",
+        "slots",
+        "points",
+        "names",
+        "present",
+        "benches",
+        "comparisons",
+    )
+
+    def __init__(self, versions, slots, points, names, present, benches):
+        self.versions = versions
+        self.slots = slots
+        self.points = points
+        self.names = names
+        self.present = present
+        self.benches = benches
+        # Week number -> WeekComparison, filled in by the owning SeasonModel
+        self.comparisons = {}
+
+
+class WeekComparison:
+    """
+    One week's starters in the actual, best and drafted lineups, aligned by slot
+
+    Rows are the slots filled in the actual or best lineup. Table columns
+    and colors for the weekly analysis view are formatted up front. Each
+    lineup's bench is kept as its Player records.
+    """
+
+    __slots__ = (
+        "week",
+        "draft_total",
+        "best_total",
+        "actual_total",
+        "positions",
+        "actual_names",
+        "actual_points",
+        "best_names",
+        "best_points",
+        "drafted_names",
+        "drafted_points",
+        "diffs",
+        "colors",
+        "table_values",
+        "table_fill_colors",
+        "drafted_bench",
+        "best_bench",
+        "actual_bench",
+    )
+
+    def __init__(self, week, totals, rows, benches):
+        self.week = week
+        self.draft_total, self.best_total, self.actual_total = totals
+        self.drafted_bench, self.best_bench, self.actual_bench = benches
+        (
+            self.positions,
+            self.actual_names,
+            self.actual_points,
+            self.best_names,
+            self.best_points,
+            self.drafted_names,
+            self.drafted_points,
+            self.diffs,
+            self.colors,
+            diff_colors,
+        ) = rows
+
+        self.table_values = [
+            self.positions,
+            self.actual_names,
+            [f"{p:.1f}" for p in self.actual_points],
+            self.best_names,
+            [f"{p:.1f}" for p in self.best_points],
+            [f"{d:+.1f}" for d in self.diffs],
+        ]
+        white = ["white"] * len(self.positions)
+        self.table_fill_colors = [white] * 5 + [[[color] for color in diff_colors]]
+
+
+class SeasonSummary:
+    """
+    Season numbers shared by the overview chart, waterfall and summary cards
+
+    Series are plain lists, ready to hand to the figure builders.
+    """
+
+    __slots__ = (
+        "draft_weeks",
+        "draft_points",
+        "actual_best_weeks",
+        "actual_best_points",
+        "actual_lineup_weeks",
+        "actual_lineup_points",
+        "avg_draft",
+        "avg_actual_best",
+        "avg_actual_lineup",
+        "transaction_impact",
+        "lineup_impact",
+        "season_efficiency",
+        "lineup_efficiency",
+        "avg_efficiency",
+        "weekly_diffs",
+        "y_min",
+        "y_max",
+    )
+
+    def __init__(self, model):
+        self.draft_weeks, self.draft_points = _as_lists(model.series("draft"))
+        self.actual_best_weeks, self.actual_best_points = _as_lists(
+            model.series("actual_best")
+        )
+        self.actual_lineup_weeks, self.actual_lineup_points = _as_lists(
+            model.series("actual_lineup")
+        )
+
+        # Weekly averages and the impact of transactions and lineup decisions
+        self.avg_draft, self.avg_actual_best, self.avg_actual_lineup = model.averages()
+        self.transaction_impact = self.avg_actual_best - self.avg_draft
+        self.lineup_impact = self.avg_actual_lineup - self.avg_actual_best
+        self.season_efficiency = (
+            self.avg_actual_lineup / self.avg_actual_best * 100
+            if self.avg_actual_best > 0
+            else 0
+        )
+
+        # Weekly efficiency and transaction diffs
+        self.lineup_efficiency = model.efficiency().tolist()
+        self.avg_efficiency = model.average_efficiency()
+        self.weekly_diffs = model.transaction_diffs().tolist()
+
+        # Y-axis range: 80% of the lowest score (or 80) to 110% of the highest
+        low, high = model.point_range()
+        self.y_min = min(80, low * 0.8)
+        self.y_max = high * 1.1
+
+    def chart_data(self):
+        """Returns the fields used by the season overview chart as a dict"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _as_lists(arrays):
+    """Converts a tuple of NumPy arrays to lists"""
+    return tuple(array.tolist() for array in arrays)
+
+
+class SeasonModel:
+    """
+    Columnar season data for one team: starter points per (scenario × week)
+
+    Weeks are the union of every scenario's weeks; a scenario missing a week
+    holds NaN there (see present). Columns live in over-allocated buffers
+    alongside running sums and extremes, so weeks added in-season are
+    applied in O(new weeks) (see extended). The per-slot tensor is built on
+    first use from the full lineup payloads.
+    """
+
+    __slots__ = (
+        "team_id",
+        "league_id",
+        "season",
+        "versions",
+        "_size",
+        "_weeks",
+        "_points",
+        "_efficiency",
+        "_diffs",
+        "_week_index",
+        "_sums",
+        "_counts",
+        "_efficiency_sum",
+        "_efficiency_count",
+        "_low",
+        "_high",
+        "_summary",
+        "_slot_tensor",
+        "_lock",
+    )
+
+    def __init__(self, team_id, league_id, season, versions, weeks, points):
+        self.team_id = team_id
+        self.league_id = league_id
+        self.season = season
+        self.versions = versions
+        self._size = len(weeks)
+        self._weeks = weeks
+        self._points = points
+        self._week_index = {int(week): j for j, week in enumerate(weeks)}
+
+        # Weekly derived series (NaN where a scenario they need is missing)
+        actual, best = points[_ACTUAL_LINEUP], points[_ACTUAL_BEST]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self._efficiency = np.where(best > 0, actual / best * 100, 0.0)
+        self._efficiency[np.isnan(actual) | np.isnan(best)] = np.nan
+        self._diffs = best - points[_DRAFT]
+
+        # Running reductions, updated as weeks are added
+        self._sums = np.nansum(points, axis=1)
+        self._counts = np.count_nonzero(~np.isnan(points), axis=1)
+        paired = self._efficiency[~np.isnan(self._efficiency)]
+        self._efficiency_sum = np.sum(paired)
+        self._efficiency_count = paired.size
+        self._low = np.nanmin(points)
+        self._high = np.nanmax(points)
+
+        self._summary = None
+        self._slot_tensor = None
+        self._lock = threading.Lock()
+
+    @property
+    def weeks(self):
+        """Week numbers, ascending"""
+        return self._weeks[: self._size]
+
+    @property
+    def points(self):
+        """Starter points per (scenario × week), NaN where missing"""
+        return self._points[:, : self._size]
+
+    @property
+    def present(self):
+        """True per (scenario × week) where the scenario has data"""
+        return ~np.isnan(self.points)
+
+    def row(self, scenario):
+        """Returns a scenario's index on the first axis"""
+        return SCENARIOS.index(scenario)
+
+    def series(self, scenario):
+        """Returns (weeks, points) arrays for the weeks a scenario has data for"""
+        row = self.row(scenario)
+        mask = self.present[row]
+        return self.weeks[mask], self.points[row, mask]
+
+    def totals(self):
+        """Returns season point totals per scenario"""
+        return self._sums.copy()
+
+    def averages(self):
+        """Returns average weekly points per scenario"""
+        return self._sums / self._counts
+
+    def point_range(self):
+        """Returns the (lowest, highest) weekly points across all scenarios"""
+        return self._low, self._high
+
+    def efficiency(self):
+        """Returns weekly lineup efficiency (% of the best possible lineup scored)"""
+        efficiency = self._efficiency[: self._size]
+        return efficiency[~np.isnan(efficiency)]
+
+    def average_efficiency(self):
+        """Returns the mean of the weekly lineup efficiencies"""
+        return self._efficiency_sum / self._efficiency_count
+
+    def transaction_diffs(self):
+        """Returns weekly best-lineup points gained over the drafted roster"""
+        diffs = self._diffs[: self._size]
+        return diffs[~np.isnan(diffs)]
+
+    def extended(self, versions, new_weeks):
+        """
+        Returns a new model with weeks added since this model's versions
+
+        New weeks are written past the end of the shared buffers (which are
+        grown by doubling), so this model's view is unchanged. Only the
+        added cells and running reductions are computed.
+
+        Args:
+            versions: Payload versions after the additions
+            new_weeks: Dict mapping scenario -> WeekTotal records added to it
+
+        Returns:
+            The extended SeasonModel, or None if a record is not a pure
+            addition (it replaces a week, or falls before the last one)
+        """
+        size = self._size
+        last_week = self._weeks[size - 1] if size else None
+        cells = []
+        added = set()
+        filled = False
+        for scenario, records in new_weeks.items():
+            s = self.row(scenario)
+            for record in records:
+                j = self._week_index.get(record.week)
+                if j is None:
+                    if last_week is not None and record.week < last_week:
+                        return None
+                    added.add(record.week)
+                elif np.isnan(self._points[s, j]):
+                    filled = True
+                else:
+                    return None
+                cells.append((s, record.week, record.total))
+
+        model = copy.copy(self)
+        model.versions = versions
+        model._size = size + len(added)
+        model._week_index = dict(self._week_index)
+        model._sums = self._sums.copy()
+        model._counts = self._counts.copy()
+        model._summary = None
+        model._slot_tensor = None
+        model._lock = threading.Lock()
+
+        # Filling an existing column copies the buffers, so readers of this
+        # model never see it change
+        if model._size > self._weeks.size:
+            model._grow(max(2 * self._weeks.size, model._size), size)
+        elif filled:
+            model._grow(self._weeks.size, size)
+
+        for j, week in enumerate(sorted(added), start=size):
+            model._weeks[j] = week
+            model._points[:, j] = np.nan
+            model._efficiency[j] = np.nan
+            model._week_index[week] = j
+
+        touched = set()
+        for s, week, total in cells:
+            j = model._week_index[week]
+            model._points[s, j] = total
+            model._sums[s] += total
+            model._counts[s] += 1
+            model._low = min(model._low, total)
+            model._high = max(model._high, total)
+            touched.add(j)
+
+        for j in touched:
+            model._update_column(j)
+        return model
+
+    def _grow(self, capacity, size):
+        """Copies the first size columns to new buffers with room for capacity weeks"""
+        weeks = np.zeros(capacity, dtype=self._weeks.dtype)
+        weeks[:size] = self._weeks[:size]
+        points = np.full((len(SCENARIOS), capacity), np.nan)
+        points[:, :size] = self._points[:, :size]
+        efficiency = np.full(capacity, np.nan)
+        efficiency[:size] = self._efficiency[:size]
+        diffs = np.full(capacity, np.nan)
+        diffs[:size] = self._diffs[:size]
+        self._weeks, self._points = weeks, points
+        self._efficiency, self._diffs = efficiency, diffs
+
+    def _update_column(self, j):
+        """Recomputes a column's derived values after cells were added to it"""
+        actual = self._points[_ACTUAL_LINEUP, j]
+        best = self._points[_ACTUAL_BEST, j]
+        if np.isnan(self._efficiency[j]) and not (np.isnan(actual) or np.isnan(best)):
+            self._efficiency[j] = actual / best * 100 if best > 0 else 0.0
+            self._efficiency_sum += self._efficiency[j]
+            self._efficiency_count += 1
+        self._diffs[j] = best - self._points[_DRAFT, j]
+
+    def summary(self):
+        """Returns the SeasonSummary for this model, computed on first use"""
+        with self._lock:
+            if self._summary is None:
+                self._summary = SeasonSummary(self)
+            return self._summary
+
+    def slot_tensor(self):
+        """Returns the SlotTensor for this team, fetching player detail on first use"""
+        with self._lock:
+            lineups = fetch_team_weeks(self.team_id, self.league_id, self.season)
+            versions = tuple(lineups["versions"][s] for s in SCENARIOS)
+            if self._slot_tensor is None or self._slot_tensor.versions != versions:
+                tensor = _build_slot_tensor(self.weeks, lineups, versions)
+                tensor.comparisons = _build_week_comparisons(
+                    self.weeks, self.points, tensor
+                )
+                self._slot_tensor = tensor
+            return self._slot_tensor
+
+    def week_comparison(self, week):
+        """Returns a week's WeekComparison, or None if any scenario lacks the week"""
+        return self.slot_tensor().comparisons.get(int(week))
+
+
+def _slot_positions(lineups):
+    """Returns (position, index) slots covering the most starters seen per position"""
+    counts = {}
+    for scenario in SCENARIOS:
+        for week in lineups[scenario]:
+            for position, players in week.starters.by_position().items():
+                counts[position] = max(counts.get(position, 0), len(players))
+    return [
+        (position, i)
+        for position, count in sorted(counts.items())
+        for i in range(count)
+    ]
+
+
+def _row_labels(positions):
+    """
+    Labels one week's table rows like the weekly analysis table ("QB", "RB-1", ...)
+
+    A position is numbered only if that week's lineups start more than one
+    player at it.
+    """
+    counts = Counter(positions)
+    seen = {}
+    labels = []
+    for position in positions:
+        seen[position] = seen.get(position, 0) + 1
+        labels.append(position + (f"-{seen[position]}" if counts[position] > 1 else ""))
+    return labels
+
+
+def _build_slot_tensor(weeks, lineups, versions):
+    """Builds a SlotTensor from a fetch_team_weeks() bundle"""
+    slots = _slot_positions(lineups)
+    slot_index = {slot: k for k, slot in enumerate(slots)}
+    week_index = {int(week): j for j, week in enumerate(weeks)}
+
+    shape = (len(SCENARIOS), len(weeks), len(slots))
+    points = np.zeros(shape)
+    names = np.full(shape, "", dtype=object)
+    present = np.zeros(shape[:2], dtype=bool)
+    benches = tuple({} for _ in SCENARIOS)
+    for s, scenario in enumerate(SCENARIOS):
+        for week in lineups[scenario]:
+            j = week_index.get(week.week)
+            if j is None:
+                continue
+            present[s, j] = True
+            benches[s][week.week] = week.bench.players
+            for position, players in week.starters.by_position().items():
+                for i, player in enumerate(players):
+                    k = slot_index[(position, i)]
+                    points[s, j, k] = player.points
+                    names[s, j, k] = player.name
+
+    return SlotTensor(
+        versions,
+        tuple(position for position, _ in slots),
+        points,
+        names,
+        present,
+        benches,
+    )
+
+
+def _build_week_comparisons(weeks, totals, tensor):
+    """Builds the WeekComparison for every week all scenarios have, from a SlotTensor"""
+    actual_names = tensor.names[_ACTUAL_LINEUP]
+    best_names = tensor.names[_ACTUAL_BEST]
+    has_actual = actual_names != ""
+    has_best = best_names != ""
+
+    # Everything per (week × slot) at once; weeks then just slice their rows
+    rows = has_actual | has_best
+    diffs = tensor.points[_ACTUAL_BEST] - tensor.points[_ACTUAL_LINEUP]
+    colors = np.where(
+        has_actual & has_best,
+        np.where(actual_names != best_names, "red", "green"),
+        "gray",
+    )
+    diff_colors = np.where(
+        diffs < 0, "#ffcccc", np.where(diffs > 0, "#ccffcc", "white")
+    )
+    positions = np.array(tensor.slots, dtype=object)
+    columns = (
+        actual_names,
+        tensor.points[_ACTUAL_LINEUP],
+        best_names,
+        tensor.points[_ACTUAL_BEST],
+        tensor.names[_DRAFT],
+        tensor.points[_DRAFT],
+        diffs,
+        colors,
+        diff_colors,
+    )
+
+    complete = tensor.present.all(axis=0) & ~np.isnan(totals).any(axis=0)
+    comparisons = {}
+    for j in np.flatnonzero(complete):
+        mask = rows[j]
+        week = int(weeks[j])
+        comparisons[week] = WeekComparison(
+            week,
+            totals[:, j].tolist(),
+            [_row_labels(positions[mask].tolist())]
+            + [column[j][mask].tolist() for column in columns],
+            tuple(
+                tensor.benches[s][week] for s in (_DRAFT, _ACTUAL_BEST, _ACTUAL_LINEUP)
+            ),
+        )
+    return comparisons
+
+
+def _build_model(team_id, league_id, season, lineups, versions):
+    """Builds a SeasonModel from a fetch_team_totals() bundle"""
+    weeks = np.array(
+        sorted({week.week for s in SCENARIOS for week in lineups[s]}), dtype=int
+    )
+    week_index = {int(week): j for j, week in enumerate(weeks)}
+    points = np.full((len(SCENARIOS), len(weeks)), np.nan)
+    for s, scenario in enumerate(SCENARIOS):
+        for week in lineups[scenario]:
+            points[s, week_index[week.week]] = week.total
+    return SeasonModel(team_id, league_id, season, versions, weeks, points)
+
+
+def _extend_model(model, lineups, versions):
+    """
+    Extends a cached model with the weeks appended to each scenario since it was built
+
+    Returns:
+        The extended SeasonModel, or None if it has to be rebuilt (a
+        scenario changed other than by an append the model has seen the
+        parent of)
+    """
+    new_weeks = {}
+    for s, scenario in enumerate(SCENARIOS):
+        if versions[s] == model.versions[s]:
+            continue
+        append = lineups["appends"].get(scenario)
+        if append is None or append[0] != model.versions[s]:
+            return None
+        # Merged weeks (new, or replacing the latest) end the tuple
+        records = lineups[scenario]
+        new_weeks[scenario] = records[len(records) - len(append[1]) :]
+    return model.extended(versions, new_weeks)
+
+
+def load_season_model(team_id, league_id=None, season=None):
+    """
+    Returns the SeasonModel for a team, built once per payload version
+
+    When a refresh only appended weeks, the cached model is extended with
+    them instead of being rebuilt.
+
+    Args:
+        team_id: The team ID to load
+        league_id: League to load from (defaults to Config.default_league_id)
+        season: Season to load (defaults to Config.default_season)
+
+    Returns:
+        A SeasonModel, or None if any scenario is unavailable
+    """
+    league_id, season = resolve_league(league_id, season)
+    lineups = fetch_team_totals(team_id, league_id, season)
+    if not bundle_is_complete(lineups):
+        logger.warning(
+            f"Season data for team {team_id} is degraded: {lineups['errors']}"
+        )
+        return None
+
+    key = (league_id, season, team_id)
+    versions = tuple(lineups["versions"][s] for s in SCENARIOS)
+    with _models_lock:
+        model = _models.get(key)
+        if model is not None and model.versions == versions:
+            _models.move_to_end(key)
+            return model
+        # Extended under the lock, as successive models share buffers
+        if model is not None:
+            model = _extend_model(model, lineups, versions)
+
+    if model is None:
+        model = _build_model(team_id, league_id, season, lineups, versions)
+    with _models_lock:
+        _models[key] = model
+        _models.move_to_end(key)
+        while len(_models) > config.cache_max_entries:
+            _models.popitem(last=False)
+    return model
+
+
+def load_season_summary(team_id, league_id=None, season=None):
+    """
+    Returns the SeasonSummary for a team, computed once per payload version
+
+    Args:
+        team_id: The team ID to load
+        league_id: League to load from (defaults to Config.default_league_id)
+        season: Season to load (defaults to Config.default_season)
+
+    Returns:
+        A SeasonSummary, or None if any scenario is unavailable
+    """
+    model = load_season_model(team_id, league_id, season)
+    return None if model is None else model.summary()
@@ -0,0 +1,65 @@
+import threading
+
+
+class _Call:
+    """An in-flight call whose result is shared with every waiting caller"""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into a single execution
+
+    The first caller for a key runs the function; callers arriving while it is
+    still running wait for it and get the same result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._executions = 0
+        self._coalesced = 0
+
+    def do(self, key, fn, *args, **kwargs):
+        """Runs fn(*args, **kwargs) unless a call for key is already in flight"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._executions += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def stats(self):
+        """Returns how many calls ran, how many were merged into them, and how many are running"""
+        with self._lock:
+            return {
+                "executions": self._executions,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls),
+            }
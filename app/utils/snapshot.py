@@ -0,0 +1,148 @@
+import argparse
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+
+from app.utils.cache import deserialize, serialize
+
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+# File layout: MAGIC, index length (uint64 LE), JSON index, then the payloads.
+# The index maps each payload's cache key ("<league>/<season>/<endpoint>_<team>")
+# to its (offset, length), relative to the end of the index; payloads use
+# cache.serialize().
+MAGIC = b"FFWSNAP1"
+_HEADER = struct.Struct("<8sQ")
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot file is invalid or lacks a requested payload"""
+
+
+def write_snapshot(path, payloads):
+    """
+    Writes payloads to a compressed, indexed snapshot file
+
+    Args:
+        path: Output file path
+        payloads: Dict mapping LineupRequest cache keys to JSON payloads
+    """
+    index = {}
+    blobs = []
+    offset = 0
+    for key, value in payloads.items():
+        blob = serialize(value)
+        index[key] = [offset, len(blob)]
+        blobs.append(blob)
+        offset += len(blob)
+
+    index_bytes = json.dumps(index, separators=(",", ":")).encode("utf-8")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(index_bytes)))
+        f.write(index_bytes)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, path)
+
+
+class Snapshot:
+    """
+    Read-only view of a snapshot file
+
+    The file is memory-mapped and only the index is parsed up front; each
+    payload is decompressed when it is first requested.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < _HEADER.size:
+            raise SnapshotError(f"{path} is not a lineup snapshot")
+        magic, index_length = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise SnapshotError(f"{path} is not a lineup snapshot")
+        index_start = _HEADER.size
+        self._data_start = index_start + index_length
+        self._index = json.loads(self._mmap[index_start : self._data_start])
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def load(self, key):
+        """Decodes and returns the payload for a cache key, raising SnapshotError if absent"""
+        location = self._index.get(key)
+        if location is None:
+            raise SnapshotError(f"{key} is not in snapshot {self.path}")
+        start = self._data_start + location[0]
+        with self._lock:
+            blob = self._mmap[start : start + location[1]]
+        return deserialize(blob)
+
+
+def export_snapshot(path, team_ids=None, league_id=None, season=None):
+    """
+    Fetches every lineup payload for a league season and writes them to a snapshot
+
+    Args:
+        path: Output file path
+        team_ids: Team IDs to export (defaults to Config.league_team_ids)
+        league_id: League to export (defaults to Config.default_league_id)
+        season: Season to export (defaults to Config.default_season)
+    """
+    # Imported here since data_fetcher itself reads snapshots
+    from app.utils.data_fetcher import (
+        LINEUP_ENDPOINTS,
+        LineupRequest,
+        fetch_league_lineups,
+        resolve_league,
+    )
+
+    league_id, season = resolve_league(league_id, season)
+    bundles = fetch_league_lineups(team_ids, league_id, season)
+    payloads = {}
+    for team_id, bundle in bundles.items():
+        if bundle["errors"]:
+            raise SnapshotError(f"Could not fetch team {team_id}: {bundle['errors']}")
+        for scenario, endpoint in LINEUP_ENDPOINTS.items():
+            request = LineupRequest(league_id, season, endpoint, team_id)
+            payloads[request.cache_key] = bundle[scenario]
+
+    write_snapshot(path, payloads)
+    logger.info(f"Wrote {len(payloads)} payloads to {path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Lineup data snapshots")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    export_parser = subparsers.add_parser(
+        "export", help="Export every team's lineup payloads from the backend"
+    )
+    export_parser.add_argument("path", help="Snapshot file to write")
+    export_parser.add_argument(
+        "--teams", type=int, nargs="+", help="Team IDs to export (default: all)"
+    )
+    export_parser.add_argument("--league", help="League ID (default: LEAGUE_ID)")
+    export_parser.add_argument(
+        "--season", type=int, help="Season to export (default: SEASON)"
+    )
+    args = parser.parse_args()
+
+    if args.command == "export":
+        export_snapshot(args.path, args.teams, args.league, args.season)
@@ -0,0 +1,67 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.components.season_line_charts import VIEW_MODES, create_season_overview
+from app.components.season_waterfall import create_season_waterfall
+from app.config import config
+from app.utils.figure_builder import to_json
+from app.utils.season_model import SeasonModel
+
+# Figures the original go.Figure builders produced for SEASONS (with the fill
+# traces always present and hover values sent as customdata), with each
+# layout's template stored once by name
+FIXTURES = Path(__file__).parent / "fixtures" / "season_figures.json"
+
+# Starter points per (draft, actual_best, actual_lineup) × week
+SEASONS = {
+    # Transactions help some weeks and hurt others, so both fills have area
+    "mixed": [
+        [110.5, 98.2, 121.0, 87.4, 102.9, 95.1],
+        [104.3, 112.8, 118.6, 99.0, 131.7, 90.2],
+        [97.1, 105.4, 118.6, 80.3, 120.0, 88.8],
+    ],
+    # Transactions only ever hurt: an empty positive fill and a negative impact
+    "declining": [
+        [120.0, 118.4, 125.2, 119.9],
+        [101.6, 99.3, 110.0, 104.7],
+        [92.4, 99.3, 95.5, 101.1],
+    ],
+}
+
+
+def _summary(points):
+    """Builds the SeasonSummary of a fixed season"""
+    points = np.array(points)
+    weeks = np.arange(1, points.shape[1] + 1)
+    return SeasonModel(1, "league", 2024, ("v",) * 3, weeks, points).summary()
+
+
+def _figures(summary, fast, monkeypatch):
+    """Builds both overview views and the waterfall as plain JSON, by name"""
+    monkeypatch.setattr(config, "fast_figures", fast)
+    figures = {
+        view_mode: create_season_overview(1, view_mode, summary=summary)
+        for view_mode in VIEW_MODES
+    }
+    figures["waterfall"] = create_season_waterfall(1, summary=summary)
+    return {name: json.loads(to_json(figure)) for name, figure in figures.items()}
+
+
+def _expected(season):
+    """Returns a season's fixture figures with their templates inlined"""
+    fixtures = json.loads(FIXTURES.read_text())
+    figures = fixtures["figures"][season]
+    for figure in figures.values():
+        layout = figure["layout"]
+        layout["template"] = fixtures["templates"][layout["template"]]
+    return figures
+
+
+@pytest.mark.parametrize("fast", [True, False], ids=["fast", "go"])
+@pytest.mark.parametrize("season", SEASONS)
+def test_figures_match_original_builders(season, fast, monkeypatch):
+    figures = _figures(_summary(SEASONS[season]), fast, monkeypatch)
+    assert figures == _expected(season)